@@ -0,0 +1,75 @@
+""" Benchmark of the 'sat_filter_rand_n_seq' modes (cocotb module, requires the simulator).
+
+- Sends the same number of random items with a sequence per item, then with a single sequence per agent.
+- Reports the wall-clock time and items per second of each mode. From the 'src/tb' directory:
+
+    make benchmark-rand-n-seq BENCH_N_ITEMS=100000
+"""
+
+import os
+import time
+import pyuvm
+
+from pyuvm import uvm_factory
+
+from sat_filter_tb_base_test import sat_filter_tb_base_test
+from sat_filter_tb_base_seq import sat_filter_tb_base_seq
+from vseqs.sat_filter_rand_n_seq import sat_filter_rand_n_seq
+
+# Number of items sent by each mode
+_BENCH_N_ITEMS_ = int(os.getenv("BENCH_N_ITEMS", default="10000"))
+
+
+class bench_sat_filter_rand_n_seq_base(sat_filter_tb_base_test):
+    """ Base benchmark: times 'sat_filter_rand_n_seq' with '_BENCH_N_ITEMS_' items.
+    """
+
+    # Mode of the virtual sequence
+    PER_ITEM_SEQS = False
+
+    def start_of_simulation_phase(self):
+
+        super().start_of_simulation_phase()
+        uvm_factory().set_type_override_by_type(sat_filter_tb_base_seq, sat_filter_rand_n_seq)
+
+    async def run_phase(self):
+
+        self.raise_objection()
+
+        await super().run_phase()
+
+        with self.virt_sequence.randomize_with() as seq:
+            seq.number_of_seqs == _BENCH_N_ITEMS_
+
+        self.virt_sequence.per_item_seqs = self.PER_ITEM_SEQS
+
+        start = time.perf_counter()
+        await (self.virt_sequence.start(self.tb_env.virtual_sequencer))
+        elapsed = time.perf_counter() - start
+
+        mode = "sequence per item" if self.PER_ITEM_SEQS else "single sequence"
+        self.logger.info(f"{mode:<20}| {_BENCH_N_ITEMS_} items in {elapsed:.3f} s ({_BENCH_N_ITEMS_/elapsed:.0f} items/s)")
+
+        self.drop_objection()
+
+
+@pyuvm.test()
+class bench_sat_filter_rand_n_seq_per_item(bench_sat_filter_rand_n_seq_base):
+    """ A producer and a consumer sequence started for each item. """
+
+    PER_ITEM_SEQS = True
+
+    def __init__(self, name="bench_sat_filter_rand_n_seq_per_item", parent=None):
+
+        super().__init__(name, parent)
+
+
+@pyuvm.test()
+class bench_sat_filter_rand_n_seq_single(bench_sat_filter_rand_n_seq_base):
+    """ All the items inside one producer and one consumer sequence body. """
+
+    PER_ITEM_SEQS = False
+
+    def __init__(self, name="bench_sat_filter_rand_n_seq_single", parent=None):
+
+        super().__init__(name, parent)
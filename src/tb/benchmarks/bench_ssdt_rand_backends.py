@@ -0,0 +1,67 @@
+""" Benchmark of the SSDT-UVC randomization backends.
+
+- Measures the items per second of each backend, randomizing one item at a time and in bulk.
+- Runs without simulator. From the 'src/tb' directory:
+
+    make benchmark-rand-backends
+
+  or
+
+    PYTHONPATH=. python benchmarks/bench_ssdt_rand_backends.py --items 10000 --data-width 4
+"""
+
+import argparse
+import random
+import time
+import warnings
+
+from uvc.ssdt.src.ssdt_common import ssdt_seq_item_override
+from uvc.ssdt.src.uvc_ssdt_rand_backend import uvc_ssdt_rand_backend_enum, ssdt_rand_backend_create
+
+
+def run_benchmark(backend_type, seq_item, n_items, seed):
+    """ Returns the items per second (one at a time, bulk) of a backend.
+    """
+
+    backend = ssdt_rand_backend_create(backend_type, random.Random(seed))
+
+    start = time.perf_counter()
+    for _ in range(0, n_items):
+        backend.randomize(seq_item)
+        assert seq_item.DATA_MIN <= seq_item.data <= seq_item.DATA_MAX
+    single_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    values = backend.randomize_bulk(seq_item, n_items)
+    bulk_time = time.perf_counter() - start
+
+    assert len(values) == n_items
+    assert all(seq_item.DATA_MIN <= value <= seq_item.DATA_MAX for value in values)
+
+    return n_items/single_time, n_items/bulk_time
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Items per second of each SSDT randomization backend.")
+    parser.add_argument("--items", type=int, default=10000, help="number of items randomized per backend")
+    parser.add_argument("--data-width", type=int, default=4, help="width of the 'data' field")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the backends")
+    args = parser.parse_args()
+
+    # Same warnings filter as the test benches (PyVSC)
+    warnings.simplefilter("ignore")
+
+    seq_item = ssdt_seq_item_override(args.data_width)("bench_seq_item")
+
+    print(f"Randomizing {args.items} items, DATA_W = {args.data_width}")
+    print(f"{'Backend':<20}| {'items/s (single)':>18} | {'items/s (bulk)':>18}")
+    print(f"{'-'*20}|{'-'*20}|{'-'*19}")
+
+    for backend_type in uvc_ssdt_rand_backend_enum:
+        single_rate, bulk_rate = run_benchmark(backend_type, seq_item, args.items, args.seed)
+        print(f"{backend_type.name:<20}| {single_rate:>18.0f} | {bulk_rate:>18.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,45 +14,50 @@
 
 #include "sat_filter_ref_model.h"
 
-static struct ref_model_output *ref_model_output = NULL;
+/**
+ * @brief Initialize the state of a reference model instance.
+ *
+ * @param state
+ * @param data_w    data width
+ * @param threshold saturation threshold
+ */
+void sat_filter_ref_model_init(struct ref_model_state* state, int data_w, unsigned long long threshold)
+{
+    state->DATA_W = data_w;
+    state->THRESHOLD = threshold;
+}
+
+/**
+ * @brief Saturation filter operation of a reference model instance (reentrant).
+ * - It is assumed that the input valid signal is 1.
+ *
+ * @param state  reference model instance
+ * @param data   input data
+ * @param output filled with the output values
+ */
+void sat_filter_ref_model_step(const struct ref_model_state* state, unsigned long long data, struct ref_model_output* output)
+{
+    output->data = (int) sat_filter_saturate(data, state->THRESHOLD, &output->overflow);
+    output->valid = 1;
+}
 
 /**
  * @brief Saturation filter operation.
  * - Receives a pointer with the inputs.
- * - Returns a pointer with the output values.
+ * - Fills the output structure given by the caller and returns it (reentrant, no static storage).
  * - The 'ref_model_input' structure is used to pass the threshold value.
  * - It is assumed that the input valid signal is always 1 when the reference model is launched.
  *
  * @param ref_model_input
+ * @param ref_model_output
  * @return struct ref_model_output*
  */
-struct ref_model_output* sat_filter_ref_model(struct ref_model_input* ref_model_input)
+struct ref_model_output* sat_filter_ref_model(const struct ref_model_input* ref_model_input, struct ref_model_output* ref_model_output)
 {
-    // Memory allocation for output structure
-    if (ref_model_output == NULL){
-        ref_model_output = (struct ref_model_output*)
-            malloc(sizeof(struct ref_model_output));
-
-        ref_model_output->valid = 0;
-        ref_model_output->data = 0;
-        ref_model_output->overflow = 0;
-    }
-
-    // Set output default values
-    ref_model_output->valid = 0;
-    ref_model_output->overflow = 0;
+    struct ref_model_state state;
 
-    if (ref_model_input->data <= ref_model_input->THRESHOLD)
-    {
-        ref_model_output->data = ref_model_input->data;
-        ref_model_output->valid = 1;
-    }
-    else
-    {
-        ref_model_output->data = ref_model_input->THRESHOLD;
-        ref_model_output->valid = 1;
-        ref_model_output->overflow = 1;
-    }
+    sat_filter_ref_model_init(&state, ref_model_input->DATA_W, ref_model_input->THRESHOLD);
+    sat_filter_ref_model_step(&state, ref_model_input->data, ref_model_output);
 
     #if _DEBUG_MODE_ == 1
     pretty_print(ref_model_input, ref_model_output);
@@ -62,7 +67,7 @@ struct ref_model_output* sat_filter_ref_model(struct ref_model_input* ref_model_
 }
 
 #if _DEBUG_MODE_ == 1
-void pretty_print(struct ref_model_input* input, struct ref_model_output* output){
+void pretty_print(const struct ref_model_input* input, const struct ref_model_output* output){
     printf("|---------------|----------------|\n");
     printf("| in_valid: %3d | out_valid: %3d |\n", input->valid, output->valid);
     printf("| in_data:  %3d | out_data:  %3d |\n", input->data, output->data);
@@ -48,7 +48,32 @@ struct ref_model_output{
     int overflow;
 };
 
-struct ref_model_output* sat_filter_ref_model(struct ref_model_input* seq_item);
-void pretty_print(struct ref_model_input* input, struct ref_model_output* output);
+/**
+ * @brief State of a reference model instance (its parameters).
+ * - The model has no global state: each instance (env, parameterization, thread) owns its state.
+ */
+struct ref_model_state{
+    int DATA_W;
+    unsigned long long THRESHOLD;
+};
+
+/**
+ * @brief Saturation of a single value (shared by the item and the batch operations).
+ *
+ * @param data      input data (valid)
+ * @param threshold saturation threshold
+ * @param overflow  set to 1 when the data is saturated, 0 otherwise
+ * @return unsigned long long output data
+ */
+static inline unsigned long long sat_filter_saturate(unsigned long long data, unsigned long long threshold, int* overflow)
+{
+    *overflow = data > threshold;
+    return *overflow ? threshold : data;
+}
+
+void sat_filter_ref_model_init(struct ref_model_state* state, int data_w, unsigned long long threshold);
+void sat_filter_ref_model_step(const struct ref_model_state* state, unsigned long long data, struct ref_model_output* output);
+struct ref_model_output* sat_filter_ref_model(const struct ref_model_input* ref_model_input, struct ref_model_output* ref_model_output);
+void pretty_print(const struct ref_model_input* input, const struct ref_model_output* output);
 
 #endif
\ No newline at end of file
@@ -1,5 +1,9 @@
+#define PY_SSIZE_T_CLEAN
 #include <Python.h>
+#include <structmember.h>
 #include <stdio.h>
+#include <stdint.h>
+#include <string.h>
 
 #include "sat_filter_ref_model.h"
 
@@ -7,9 +11,6 @@
 // Functions to be exposed to Python
 // -------------------------------------------------------------
 
-struct ref_model_input* input_struct = NULL;
-struct ref_model_output* output_struct = NULL;
-
 static PyObject* sat_filter_operation(PyObject* self, PyObject* args){
 
     // Default python object
@@ -21,30 +22,39 @@ static PyObject* sat_filter_operation(PyObject* self, PyObject* args){
     }
 
     // Access the fields of the Python object
-    PyObject* DATA_W_obj    = PyObject_GetAttrString(input_struct_obj, "DATA_W");
-    PyObject* THRESHOLD_obj = PyObject_GetAttrString(input_struct_obj, "THRESHOLD");
-    PyObject* in_valid_obj  = PyObject_GetAttrString(input_struct_obj, "valid");
-    PyObject* in_data_obj   = PyObject_GetAttrString(input_struct_obj, "data");
+    PyObject* DATA_W_obj    = NULL;
+    PyObject* THRESHOLD_obj = NULL;
+    PyObject* in_valid_obj  = NULL;
+    PyObject* in_data_obj   = NULL;
 
-    // Create input structure (required by sat_filter_operation())
-    if(input_struct == NULL)
-    {
-        input_struct = (struct ref_model_input*) malloc(sizeof(struct ref_model_input));
+    if ((DATA_W_obj    = PyObject_GetAttrString(input_struct_obj, "DATA_W")) == NULL ||
+        (THRESHOLD_obj = PyObject_GetAttrString(input_struct_obj, "THRESHOLD")) == NULL ||
+        (in_valid_obj  = PyObject_GetAttrString(input_struct_obj, "valid")) == NULL ||
+        (in_data_obj   = PyObject_GetAttrString(input_struct_obj, "data")) == NULL){
+        goto error;
     }
 
+    // Input/output structures of this call (no global state)
+    struct ref_model_input input_struct;
+    struct ref_model_output output_struct;
+
     // Extract the values from the Python objects
-    input_struct->DATA_W  = PyLong_AsLong(DATA_W_obj);
-    input_struct->THRESHOLD  = PyLong_AsLong(THRESHOLD_obj);
-    input_struct->valid  = PyLong_AsLong(in_valid_obj);
-    input_struct->data  = PyLong_AsLong(in_data_obj);
+    input_struct.DATA_W  = PyLong_AsLong(DATA_W_obj);
+    input_struct.THRESHOLD  = PyLong_AsLong(THRESHOLD_obj);
+    input_struct.valid  = PyLong_AsLong(in_valid_obj);
+    input_struct.data  = PyLong_AsLong(in_data_obj);
+
+    if (PyErr_Occurred()){
+        goto error;
+    }
 
     // Reference Model Operation
-    output_struct = sat_filter_ref_model(input_struct);
+    sat_filter_ref_model(&input_struct, &output_struct);
 
     // Set values return by C function to Python object
-    PyObject* return_out_valid_obj = PyLong_FromLong(output_struct->valid);
-    PyObject* return_out_data_obj = PyLong_FromLong(output_struct->data);
-    PyObject* return_overflow_obj = PyLong_FromLong(output_struct->overflow);
+    PyObject* return_out_valid_obj = PyLong_FromLong(output_struct.valid);
+    PyObject* return_out_data_obj = PyLong_FromLong(output_struct.data);
+    PyObject* return_overflow_obj = PyLong_FromLong(output_struct.overflow);
 
     PyObject_SetAttrString(output_struct_obj, "valid", return_out_valid_obj);
     PyObject_SetAttrString(output_struct_obj, "data", return_out_data_obj);
@@ -61,13 +71,265 @@ static PyObject* sat_filter_operation(PyObject* self, PyObject* args){
     Py_CLEAR(return_overflow_obj);
 
     Py_RETURN_NONE;
+
+error:
+    Py_CLEAR(DATA_W_obj);
+    Py_CLEAR(THRESHOLD_obj);
+    Py_CLEAR(in_valid_obj);
+    Py_CLEAR(in_data_obj);
+
+    return NULL;
+}
+
+// -------------------------------------------------------------
+// Batch operation over buffer-protocol objects
+// -------------------------------------------------------------
+
+/**
+ * @brief Get a 1-D buffer of unsigned/signed integers (any item size, any stride, native byte order).
+ */
+static int get_int_buffer(PyObject* obj, Py_buffer* view, int flags, const char* name){
+
+    if (PyObject_GetBuffer(obj, view, flags | PyBUF_STRIDES | PyBUF_FORMAT) < 0){
+        return -1;
+    }
+
+    const char* format = view->format == NULL ? "B" : view->format;
+    if (format[0] == '@' || format[0] == '='){
+        format++;
+    }
+
+    if (view->ndim != 1 || strlen(format) != 1 || strchr("bBhHiIlLqQ", format[0]) == NULL){
+        PyErr_Format(PyExc_TypeError, "'%s' must be a 1-D buffer of integers (format '%s')", name, view->format);
+        PyBuffer_Release(view);
+        return -1;
+    }
+
+    return 0;
+}
+
+/**
+ * @brief Load the i-th item of a buffer (taken as unsigned).
+ */
+static inline unsigned long long buffer_load(const Py_buffer* view, Py_ssize_t i){
+
+    const char* item = (const char*) view->buf + i*view->strides[0];
+
+    switch (view->itemsize){
+        case 1: return *(const uint8_t*) item;
+        case 2: return *(const uint16_t*) item;
+        case 4: return *(const uint32_t*) item;
+        default: return *(const uint64_t*) item;
+    }
+}
+
+/**
+ * @brief Store a value in the i-th item of a buffer (truncated to the item size).
+ */
+static inline void buffer_store(Py_buffer* view, Py_ssize_t i, unsigned long long value){
+
+    char* item = (char*) view->buf + i*view->strides[0];
+
+    switch (view->itemsize){
+        case 1: *(uint8_t*) item = (uint8_t) value; break;
+        case 2: *(uint16_t*) item = (uint16_t) value; break;
+        case 4: *(uint32_t*) item = (uint32_t) value; break;
+        default: *(uint64_t*) item = (uint64_t) value; break;
+    }
+}
+
+/**
+ * @brief Runs the saturation over all the items of 'data_in' in a single C loop (all the inputs are valid).
+ * - The outputs are written in place in the caller buffers, which must hold at least 'n' items.
+ * - The GIL is released during the loop, so several threads can run batches in parallel.
+ * - Returns 'n'.
+ */
+static PyObject* run_operation_batch(unsigned long long threshold, PyObject* data_in_obj, PyObject* data_out_obj,
+                                     PyObject* valid_out_obj, PyObject* overflow_out_obj){
+
+    PyObject* result = NULL;
+    Py_buffer data_in, data_out, valid_out, overflow_out;
+    int has_valid = valid_out_obj != Py_None;
+    int has_overflow = overflow_out_obj != Py_None;
+
+    if (get_int_buffer(data_in_obj, &data_in, PyBUF_SIMPLE, "data_in") < 0){
+        return NULL;
+    }
+    if (get_int_buffer(data_out_obj, &data_out, PyBUF_WRITABLE, "data_out") < 0){
+        goto release_data_in;
+    }
+    if (has_valid && get_int_buffer(valid_out_obj, &valid_out, PyBUF_WRITABLE, "valid_out") < 0){
+        goto release_data_out;
+    }
+    if (has_overflow && get_int_buffer(overflow_out_obj, &overflow_out, PyBUF_WRITABLE, "overflow_out") < 0){
+        goto release_valid_out;
+    }
+
+    Py_ssize_t n = data_in.shape[0];
+
+    if (data_out.shape[0] < n || (has_valid && valid_out.shape[0] < n) || (has_overflow && overflow_out.shape[0] < n)){
+        PyErr_Format(PyExc_ValueError, "output buffers must hold at least %zd items", n);
+        goto release_overflow_out;
+    }
+
+    // Reference Model Operation (the buffers stay exported, so the GIL is not needed)
+    Py_BEGIN_ALLOW_THREADS
+
+    for (Py_ssize_t i = 0; i < n; i++){
+        int overflow;
+        buffer_store(&data_out, i, sat_filter_saturate(buffer_load(&data_in, i), threshold, &overflow));
+
+        if (has_valid){
+            buffer_store(&valid_out, i, 1);
+        }
+        if (has_overflow){
+            buffer_store(&overflow_out, i, overflow);
+        }
+    }
+
+    Py_END_ALLOW_THREADS
+
+    result = PyLong_FromSsize_t(n);
+
+    // Clean up
+release_overflow_out:
+    if (has_overflow){
+        PyBuffer_Release(&overflow_out);
+    }
+release_valid_out:
+    if (has_valid){
+        PyBuffer_Release(&valid_out);
+    }
+release_data_out:
+    PyBuffer_Release(&data_out);
+release_data_in:
+    PyBuffer_Release(&data_in);
+
+    return result;
 }
 
+/**
+ * @brief sat_filter_operation_batch(threshold, data_in, data_out, valid_out=None, overflow_out=None) -> n
+ */
+static PyObject* sat_filter_operation_batch(PyObject* self, PyObject* args, PyObject* kwargs){
+
+    static char* kwlist[] = {"threshold", "data_in", "data_out", "valid_out", "overflow_out", NULL};
+
+    unsigned long long threshold;
+    PyObject* data_in_obj;
+    PyObject* data_out_obj;
+    PyObject* valid_out_obj = Py_None;
+    PyObject* overflow_out_obj = Py_None;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "KOO|OO", kwlist, &threshold,
+                                     &data_in_obj, &data_out_obj, &valid_out_obj, &overflow_out_obj)){
+        return NULL;
+    }
+
+    return run_operation_batch(threshold, data_in_obj, data_out_obj, valid_out_obj, overflow_out_obj);
+}
+
+// -------------------------------------------------------------
+// Model type: parameters configured once per instance
+// -------------------------------------------------------------
+
+typedef struct {
+    PyObject_HEAD
+    struct ref_model_state state;   // Own parameters of the instance
+} model_object;
+
+static int model_init(model_object* self, PyObject* args, PyObject* kwargs){
+
+    static char* kwlist[] = {"threshold", "data_w", NULL};
+
+    unsigned long long threshold = _THRESHOLD_;
+    int data_w = _DATA_W_;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|Ki", kwlist, &threshold, &data_w)){
+        return -1;
+    }
+
+    sat_filter_ref_model_init(&self->state, data_w, threshold);
+
+    return 0;
+}
+
+/**
+ * @brief model.operation(data) -> (valid, data, overflow)
+ * - Fast-call: a single positional int, no attribute access.
+ */
+static PyObject* model_operation(model_object* self, PyObject* const* args, Py_ssize_t nargs){
+
+    if (nargs != 1){
+        PyErr_Format(PyExc_TypeError, "operation() takes exactly 1 argument (%zd given)", nargs);
+        return NULL;
+    }
+
+    unsigned long long data = PyLong_AsUnsignedLongLong(args[0]);
+    if (data == (unsigned long long) -1 && PyErr_Occurred()){
+        return NULL;
+    }
+
+    // Reference Model Operation (the input is valid)
+    int overflow;
+    data = sat_filter_saturate(data, self->state.THRESHOLD, &overflow);
+
+    return Py_BuildValue("(iKi)", 1, data, overflow);
+}
+
+/**
+ * @brief model.operation_batch(data_in, data_out, valid_out=None, overflow_out=None) -> n
+ */
+static PyObject* model_operation_batch(model_object* self, PyObject* args, PyObject* kwargs){
+
+    static char* kwlist[] = {"data_in", "data_out", "valid_out", "overflow_out", NULL};
+
+    PyObject* data_in_obj;
+    PyObject* data_out_obj;
+    PyObject* valid_out_obj = Py_None;
+    PyObject* overflow_out_obj = Py_None;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO|OO", kwlist,
+                                     &data_in_obj, &data_out_obj, &valid_out_obj, &overflow_out_obj)){
+        return NULL;
+    }
+
+    return run_operation_batch(self->state.THRESHOLD, data_in_obj, data_out_obj, valid_out_obj, overflow_out_obj);
+}
+
+static PyMethodDef model_methods[] = {
+    {"operation", (PyCFunction)(void(*)(void)) model_operation, METH_FASTCALL,
+     "run operation over a single (valid) item: (data) -> (valid, data, overflow)"},
+    {"operation_batch", (PyCFunction)(void(*)(void)) model_operation_batch, METH_VARARGS | METH_KEYWORDS,
+     "run operation over a buffer of items: (data_in, data_out, valid_out=None, overflow_out=None) -> n"},
+    {NULL, NULL, 0, NULL}
+};
+
+static PyMemberDef model_members[] = {
+    {"threshold", T_ULONGLONG, offsetof(model_object, state.THRESHOLD), READONLY, "saturation threshold"},
+    {"data_w", T_INT, offsetof(model_object, state.DATA_W), READONLY, "data width"},
+    {NULL, 0, 0, 0, NULL}
+};
+
+static PyTypeObject model_type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "sat_filter_ref_model_py_wrapper.model",
+    .tp_doc = "Saturation Filter Reference Model instance: model(threshold=_THRESHOLD_, data_w=_DATA_W_)",
+    .tp_basicsize = sizeof(model_object),
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_new = PyType_GenericNew,
+    .tp_init = (initproc) model_init,
+    .tp_methods = model_methods,
+    .tp_members = model_members,
+};
+
 // -------------------------------------------------------------
 // Method definition object for the module
 // -------------------------------------------------------------
 static PyMethodDef sat_filter_ref_model_wrapper_methods[] = {
     {"sat_filter_operation", sat_filter_operation, METH_VARARGS, "run operation"},
+    {"sat_filter_operation_batch", (PyCFunction)(void(*)(void)) sat_filter_operation_batch, METH_VARARGS | METH_KEYWORDS,
+     "run operation over a buffer of items: (threshold, data_in, data_out, valid_out=None, overflow_out=None) -> n"},
     {NULL, NULL, 0, NULL}
 };
 
@@ -86,5 +348,22 @@ static struct PyModuleDef sat_filter_ref_model_py_wrapper = {
 // Module initialization function
 // -------------------------------------------------------------
 PyMODINIT_FUNC PyInit_sat_filter_ref_model_py_wrapper(void) {
-    return PyModule_Create(&sat_filter_ref_model_py_wrapper);
+
+    if (PyType_Ready(&model_type) < 0){
+        return NULL;
+    }
+
+    PyObject* module = PyModule_Create(&sat_filter_ref_model_py_wrapper);
+    if (module == NULL){
+        return NULL;
+    }
+
+    Py_INCREF(&model_type);
+    if (PyModule_AddObject(module, "model", (PyObject*) &model_type) < 0){
+        Py_DECREF(&model_type);
+        Py_DECREF(module);
+        return NULL;
+    }
+
+    return module;
 }
\ No newline at end of file
@@ -1,39 +1,21 @@
-class SeqItem():
+from array import array
+from ref_model import sat_filter_ref_model_py_wrapper
 
-    def __init__(self, DATA_W = 4, THRESHOLD = 8):
-        self.THRESHOLD:  int = THRESHOLD
-        self.DATA_W:  int = DATA_W
-        self.valid:  int = 0
-        self.data:   int = 0
+# Reference model instances shared by the worker threads, per (threshold, data_w) (their state is read-only)
+_models = {}
 
-    def set_values(self, data: int, valid: int = 1):
-        self.data = data
-        self.valid = valid
 
-    def __iter__(self):
-        objects = ['DATA_W', 'THRESHOLD',
-                   'valid', 'data'
-                   ]
-        return objects.__iter__()
+def sat_filter_ref_model_predict(threshold: int, data_w: int, data_in: array) -> array:
+    """ Output 'data' of a buffer of (valid) input 'data'.
+    - Module level function, so it can be submitted to a thread pool (the C model releases the GIL).
+    """
 
-    def __str__(self):
-        return f"DATA_W = {self.DATA_W}\n" + \
-                f"THRESHOLD = {self.THRESHOLD}\n" + \
-                f"valid = {self.valid}\n" + \
-                f"data = {self.data}\n"
+    model = _models.get((threshold, data_w))
+    if model is None:
+        model = _models[(threshold, data_w)] = sat_filter_ref_model_py_wrapper.model(threshold, data_w)
 
+    data_out = array('Q', bytes(8*len(data_in)))
+    model.operation_batch(data_in, data_out)
 
-class SeqItemOut(SeqItem):
+    return data_out
 
-    def __init__(self):
-        super().__init__()
-        self.overflow = 0
-
-    def __iter__(self):
-        objects = [ 'valid', 'data', 'overflow']
-        return objects.__iter__()
-
-    def __str__(self):
-        return f"valid = {self.valid}\n" + \
-                f"data = {self.data}\n" + \
-                f"overflow = {self.overflow}\n"
\ No newline at end of file
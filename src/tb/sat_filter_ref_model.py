@@ -2,13 +2,24 @@
 """
 
 import cocotb
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from cocotb.queue import Queue
+from cocotb.triggers import RisingEdge
 from pyuvm import uvm_component, uvm_analysis_port, uvm_tlm_analysis_fifo
 from ref_model import sat_filter_ref_model_py_wrapper as ref_model
-from ref_model.sat_filter_ref_model_utils import SeqItem, SeqItemOut
+from ref_model.sat_filter_ref_model_utils import sat_filter_ref_model_predict
+from uvc.ssdt.src.uvc_ssdt_mon_item import uvc_ssdt_mon_batch
+from sat_filter_tb_config import sat_filter_ref_model_pool_enum
 
 
 class sat_filter_ref_model(uvm_component):
     """ Handler for Reference Model.
+    - For narrow data (see 'ref_model_lut_max_width'), the output of every input is precomputed
+      with the C model in a lookup table, so the prediction is an index instead of a C call.
+    - With a worker pool (see 'ref_model_pool'), the predictions run in the pool, overlapped with the
+      simulation, and are published in order. An objection is held while jobs are in flight, so the
+      run phase does not end before their results are published.
     """
 
     def __init__(self, name="sat_filter_ref_model", parent=None):
@@ -18,15 +29,40 @@ class sat_filter_ref_model(uvm_component):
         # analysis port for sending ref model item
         self.analysis_port = None
 
+        # Configuration object
+        self.cfg = None
+
         # FIFOs for connecting to UVC's ap's
         self.uvc_ssdt_producer_fifo = None
         self.uvc_ssdt_consumer_fifo = None
 
         self.threshold = None
+        self.data_width = None
+
+        # Reference model instance (configured once with the DUT parameters)
+        self.model = None
+
+        # Lookup table: output 'data' of each input 'data' (None: computed per item)
+        self.lut = None
+
+        # Worker pool of the predictions (None: inline)
+        self.executor = None
 
     def build_phase(self):
         super().build_phase()
 
+        # Get the DUT parameters from the configuration object
+        self.cfg = self.cdb_get("cfg", "")
+        self.threshold = self.cfg.threshold
+        self.data_width = self.cfg.data_width
+
+        self.model = ref_model.model(self.threshold, self.data_width)
+
+        if self.cfg.ref_model_pool is sat_filter_ref_model_pool_enum.THREAD:
+            self.executor = ThreadPoolExecutor(max_workers=self.cfg.ref_model_pool_workers)
+        elif self.cfg.ref_model_lut and self.data_width <= self.cfg.ref_model_lut_max_width:
+            self.build_lut()
+
         self.uvc_ssdt_producer_fifo = uvm_tlm_analysis_fifo("uvc_ssdt_producer_fifo", self)
         self.uvc_ssdt_consumer_fifo = uvm_tlm_analysis_fifo("uvc_ssdt_consumer_fifo", self)
 
@@ -36,33 +72,168 @@ class sat_filter_ref_model(uvm_component):
         await super().run_phase()
 
         # Sample item from UVC producer's FIFO
-        cocotb.start_soon(self.sample_item(self.uvc_ssdt_producer_fifo))
+        if self.executor is not None:
+            cocotb.start_soon(self.sample_item_pool(self.uvc_ssdt_producer_fifo))
+        else:
+            cocotb.start_soon(self.sample_item(self.uvc_ssdt_producer_fifo))
 
-    async def sample_item(self, fifo):
+    def final_phase(self):
+        super().final_phase()
+
+        # All the jobs were published before the end of the run phase
+        if self.executor is not None:
+            self.executor.shutdown()
 
-        # The 'ref_model_input' structure is used to pass the threshold value.
-        seq_input_item = SeqItem(THRESHOLD=self.threshold)
-        seq_output_item = SeqItemOut()
+    async def sample_item(self, fifo):
 
         while True:
             item = await fifo.get()
 
+            if isinstance(item, uvc_ssdt_mon_batch):
+                self.write_batch(item)
+                continue
+
             self.logger.debug(f"-------------------------------")
-            self.logger.info(f"Get item : {item}")
+            self.logger.debug(f"Get item : {item}")
 
-            input_item = item.clone()
-            output_item = item.clone()
+            output_item = self.predict(item)
 
-            self.logger.debug(f"FIFO : {input_item.get_name()}")
+            self.logger.debug(f"output_item : {output_item}")
+            self.analysis_port.write(output_item)
 
-            # Update values
-            seq_input_item.set_values(item.data)
+    async def sample_item_pool(self, fifo):
+        """ Copy the items as soon as they are taken out of the FIFO, and queue them for 'submit_jobs()'.
+        - The monitor may recycle its items (see 'mon_pool_size'), so they must not wait in the FIFO
+          while the submission is blocked by the backpressure.
+        """
 
-            # Send input item to reference model
-            ref_model.sat_filter_operation(seq_input_item, seq_output_item)
+        pending = Queue()   # Copied items waiting for their job
+        cocotb.start_soon(self.submit_jobs(pending))
 
-            output_item.data = seq_output_item.data
-            output_item.valid = seq_output_item.valid
+        while True:
+            items = uvc_ssdt_mon_batch()
+            self.append_items(await fifo.get(), items)
 
-            self.logger.debug(f"output_item : {output_item}")
-            self.analysis_port.write(output_item)
\ No newline at end of file
+            success, item = fifo.try_get()
+            while success:
+                self.append_items(item, items)
+                success, item = fifo.try_get()
+
+            # Dropped once the results are published
+            self.raise_objection()
+            pending.put_nowait(items)
+
+    async def submit_jobs(self, pending):
+        """ Submit all the copied items waiting as a single job of the worker pool.
+        - The submission waits while 'ref_model_max_in_flight' jobs are pending (backpressure).
+        """
+
+        in_flight = Queue(maxsize=self.cfg.ref_model_max_in_flight)
+        cocotb.start_soon(self.publish_results(in_flight))
+
+        while True:
+            items = await pending.get()
+            n_groups = 1
+            while not pending.empty():
+                items.extend(pending.get_nowait())
+                n_groups += 1
+
+            data_in = array('Q', [item.data for item in items])
+            future = self.executor.submit(sat_filter_ref_model_predict, self.threshold, self.data_width, data_in)
+
+            self.logger.debug(f"Job of {len(items)} items submitted")
+            await in_flight.put((items, n_groups, future))
+
+    def append_items(self, item, items):
+        """ Append a copy of an item (or of a batch of items).
+        """
+        if isinstance(item, uvc_ssdt_mon_batch):
+            items.extend(batch_item.clone() for batch_item in item)
+        else:
+            items.append(item.clone())
+
+    async def publish_results(self, in_flight):
+        """ Publish the results of the jobs, in submission order.
+        - A worker cannot wake up the simulator, so the job is checked on each clock edge until it is done.
+        """
+
+        clk_edge = RisingEdge(self.cfg.ssdt_prod_cfg.vif.clk)
+
+        while True:
+            items, n_groups, future = await in_flight.get()
+
+            while not future.done():
+                await clk_edge
+
+            try:
+                data_out = future.result()
+            except Exception as error:
+                # The items of the job are not published (the scoreboard reports them as not compared)
+                self.logger.error(f"Prediction of a job of {len(items)} items failed: {error!r}")
+            else:
+                for output_item, data in zip(items, data_out):
+                    output_item.data = data
+
+                self.analysis_port.write(items)
+
+            for _ in range(0, n_groups):
+                self.drop_objection()
+
+    def build_lut(self):
+        """ Precompute the output 'data' of all the 2**DATA_W inputs, with the C model as oracle.
+        """
+
+        data_in = array('Q', range(0, 2**self.data_width))
+        data_out = array('Q', bytes(8*len(data_in)))
+
+        self.model.operation_batch(data_in, data_out)
+
+        # Indexing a list returns the stored int objects (no allocation per item)
+        self.lut = data_out.tolist()
+
+        self.logger.debug(f"Lookup table of {len(self.lut)} entries built (DATA_W = {self.data_width})")
+
+    def write_batch(self, batch):
+        """ Predict a batch of items and publish the results as a single batch.
+        - The whole batch goes through the lookup table or the reference model in a single call.
+        """
+
+        self.logger.debug(f"Get batch of {len(batch)} items")
+
+        output_batch = uvc_ssdt_mon_batch(item.clone() for item in batch)
+
+        if self.lut is not None:
+            lut = self.lut
+            for output_item in output_batch:
+                output_item.data = lut[output_item.data]
+
+            self.analysis_port.write(output_batch)
+            return
+
+        data_in = array('Q', [item.data for item in batch])
+        data_out = array('Q', bytes(8*len(batch)))
+
+        self.model.operation_batch(data_in, data_out)
+
+        for output_item, data in zip(output_batch, data_out):
+            output_item.data = data
+
+        self.analysis_port.write(output_batch)
+
+    def predict(self, item):
+        """ Run the reference model over a single item.
+        """
+
+        output_item = item.clone()
+
+        self.logger.debug(f"FIFO : {item.get_name()}")
+
+        # Only valid outputs are published, so just the 'data' is carried
+        if self.lut is not None:
+            output_item.data = self.lut[item.data]
+        else:
+            # Send input 'data' to reference model
+            valid, data, overflow = self.model.operation(item.data)
+            output_item.data = data
+
+        return output_item
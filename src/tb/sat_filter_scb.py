@@ -4,13 +4,106 @@
 - Includes the Reference Model.
 """
 
+import logging
 import cocotb
+from array import array
+from cocotb.triggers import Event, ClockCycles
+from collections import deque
 from pyuvm import uvm_scoreboard, uvm_analysis_port, uvm_tlm_analysis_fifo
-from cocotb.queue import Queue
+from uvc.ssdt.src.uvc_ssdt_mon_item import uvc_ssdt_mon_batch
+from sat_filter_tb_config import sat_filter_scb_match_enum
+from sat_filter_scb_log import sat_filter_scb_log_writer
+
+# Sides of the comparison
+_CONSUMER_ = 0
+_REF_MODEL_ = 1
+
+# Bins of the latency histogram (in clock cycles). The last bin also counts longer latencies.
+_LATENCY_HIST_SIZE_ = 16
+
+
+class sat_filter_scb_keyed_matcher():
+    """ Out-of-order matcher: the pending items of each side are indexed by key (O(1) matching).
+    - The items are stored as opaque values ('data' and 'time' for the scoreboard).
+    - Several items may share a key, they are then matched in arrival order.
+    - With a 'window', an item still pending after 'window' items arrived on the other side expires.
+    """
+
+    def __init__(self, window=0):
+
+        self.window = window
+
+        self.pending = ({}, {})             # key -> deque of (value, deadline), per side
+        self.expiry = (deque(), deque())    # (deadline, key) in arrival order, per side
+        self.count = [0, 0]                 # Items received, per side
+        self.n_pending = [0, 0]             # Items pending, per side
+        self.max_pending = [0, 0]           # Max. items pending, per side
+
+    def add(self, side, key, value):
+        """ Add an item of 'side'.
+        - Returns the value of the pending item of the other side with the same key.
+        - Otherwise, the item is left pending and None is returned.
+        """
+
+        other = 1 - side
+        self.count[side] += 1
+
+        entries = self.pending[other].get(key)
+        if entries:
+            other_value = entries.popleft()[0]
+            if not entries:
+                del self.pending[other][key]
+            self.n_pending[other] -= 1
+            return other_value
+
+        deadline = self.count[other] + self.window
+        entries = self.pending[side].get(key)
+        if entries is None:
+            entries = self.pending[side][key] = deque()
+        entries.append((value, deadline))
+
+        if self.window:
+            self.expiry[side].append((deadline, key))
+
+        self.n_pending[side] += 1
+        self.max_pending[side] = max(self.max_pending[side], self.n_pending[side])
+
+        return None
+
+    def expire(self, side):
+        """ Remove the items of 'side' that waited too long. Returns their (key, value).
+        """
+
+        expired = []
+        other_count = self.count[1 - side]
+        expiry = self.expiry[side]
+        pending = self.pending[side]
+
+        while expiry and expiry[0][0] < other_count:
+            deadline, key = expiry.popleft()
+
+            # Skip the items that were matched meanwhile
+            entries = pending.get(key)
+            if entries and entries[0][1] == deadline:
+                expired.append((key, entries.popleft()[0]))
+                if not entries:
+                    del pending[key]
+                self.n_pending[side] -= 1
+
+        return expired
 
 
 class sat_filter_scoreboard(uvm_scoreboard):
-    """ Scoreboard for Saturation Filter. """
+    """ Scoreboard for Saturation Filter.
+    - IN_ORDER: the 'data' of the consumer and of the Ref. Model are compared in arrival order.
+    - KEYED: the items are matched by the key given by 'scb_key_fn', whatever their order.
+    - Each side drains whatever is available in its FIFO at once, so neither side waits for the other.
+    - Every comparison is recorded in a binary log (see 'sat_filter_scb_log'), only mismatches are printed.
+    - The latency (in clock cycles) between the input and the output of each item is checked and kept in a histogram.
+    - It holds an objection while items wait for their counterpart, so the test ends once the DUT pipeline is drained.
+      It gives up when no item is compared for 'scb_drain_timeout' clock cycles (e.g. an output without input).
+      Items still not compared at the end of the test are errors.
+    """
 
     def __init__(self, name="sat_filter_scoreboard", parent=None):
 
@@ -25,9 +118,38 @@ class sat_filter_scoreboard(uvm_scoreboard):
         self.uvc_ssdt_consumer_fifo = None
         self.ref_model_fifo = None
 
+        # IN_ORDER: 'data' (and 'time') waiting for its counterpart (plain integers, unbounded)
+        self.uvc_ssdt_consumer_data = deque()
+        self.ref_model_data = deque()
+        self.uvc_ssdt_consumer_time = deque()
+        self.ref_model_time = deque()
+
+        # KEYED: matcher and key function
+        self.matcher = None
+        self.key_fn = None
+
+        # Log of the comparisons
+        self.log_writer = None
+
+        # Number of items per latency (in clock cycles)
+        self.latency_histogram = array("Q", bytes(8*_LATENCY_HIST_SIZE_))
+
         # recording number of successes and failures
         self.succes = 0
         self.failure = 0
+        self.n_compared = 0     # Pairs of items compared
+
+        # Maximum number of 'data' waiting on each side
+        self.uvc_ssdt_consumer_max_depth = 0
+        self.ref_model_max_depth = 0
+
+        # Objection raised while items wait for their counterpart
+        self.pending_objection = False
+        self.n_objections = 0           # Objections raised (to tell a new objection from a stalled one)
+
+        # 'wait_compared()': set once 'compared_target' pairs were compared (or the drain gave up)
+        self.compared_target = None
+        self.compared_event = Event()
 
     def build_phase(self):
 
@@ -44,67 +166,233 @@ class sat_filter_scoreboard(uvm_scoreboard):
         self.uvc_ssdt_consumer_fifo = uvm_tlm_analysis_fifo("uvc_ssdt_consumer_fifo", self)
         self.ref_model_fifo = uvm_tlm_analysis_fifo("ref_model_fifo", self)
 
-        # Queues to store output of Ref. Model
-        self.uvc_ssdt_consumer_queue = Queue(maxsize=1)
-        self.ref_model_queue = Queue(maxsize=1)
+        # Matching strategy
+        if self.cfg.scb_match_mode is sat_filter_scb_match_enum.KEYED:
+            # The monitors number the beats of each interface independently ('tr_id'), which only pairs
+            # the items in order. The key must be something the DUT carries from its input to its output.
+            if self.cfg.scb_key_fn is None:
+                raise ValueError("KEYED matching needs a key function ('scb_key_fn')")
+
+            self.matcher = sat_filter_scb_keyed_matcher(self.cfg.scb_match_window)
+            self.key_fn = self.cfg.scb_key_fn
+
+        if self.cfg.scb_log_file is not None:
+            self.log_writer = sat_filter_scb_log_writer(self.cfg.scb_log_file)
 
     async def run_phase(self):
         """
-        - Get the item from the FIFOs
+        - Drain the FIFOs of each side
         - Compare the samples received
         """
 
         await super().run_phase()
 
-        cocotb.start_soon(self.sample_ap_uvc(self.uvc_ssdt_consumer_fifo, self.uvc_ssdt_consumer_queue))
-        cocotb.start_soon(self.sample_ap_uvc(self.ref_model_fifo, self.ref_model_queue))
-
-        while True:
-
-            # Get items from queues
-            self.uvc_ssdt_consumer_item = await self.uvc_ssdt_consumer_queue.get()
-            self.ref_model_item = await self.ref_model_queue.get()
+        cocotb.start_soon(self.drain_fifo(self.uvc_ssdt_consumer_fifo, _CONSUMER_))
+        cocotb.start_soon(self.drain_fifo(self.ref_model_fifo, _REF_MODEL_))
 
-            # Print items as they arrive (only in DEBUG level)
-            self.print_scb()
-
-            # compare items and update result
-            if (self.uvc_ssdt_consumer_item == self.ref_model_item):
-                self.succes += 1
-                self.logger.info(f"Items are identical: {self.uvc_ssdt_consumer_item}")
-            else:
-                self.logger.error(f"Items not identical: \n \
-                    {self.uvc_ssdt_consumer_item}, \n \
-                    {self.ref_model_item}")
-                self.failure += 1
+        if self.cfg.scb_drain_timeout:
+            cocotb.start_soon(self.drain_watchdog(self.cfg.scb_drain_timeout))
 
     # Report the results of the comparisons
     def check_phase(self):
 
         super().check_phase()
 
+        if self.matcher is not None:
+            self.uvc_ssdt_consumer_max_depth, self.ref_model_max_depth = self.matcher.max_pending
+            n_consumer, n_ref_model = self.matcher.n_pending
+        else:
+            n_consumer, n_ref_model = len(self.uvc_ssdt_consumer_data), len(self.ref_model_data)
+
         self.logger.info(f"Scoreboard found {self.succes} successes and {self.failure} failures")
+
+        if self.log_writer is not None:
+            self.log_writer.close()
+            self.logger.info(f"Comparisons logged in '{self.log_writer.path}' ({self.log_writer.n_records} records)")
+
+        latencies = ", ".join(f"{latency}: {n}" for latency, n in enumerate(self.latency_histogram) if n)
+        self.logger.info(f"Latency histogram (clock cycles: items): {latencies}")
+        self.logger.info(f"Max. queue depth: consumer = {self.uvc_ssdt_consumer_max_depth}, Ref. Model = {self.ref_model_max_depth}")
+
+        # Items still in flight when the test ended
+        if n_consumer or n_ref_model:
+            self.logger.error(f"Not compared: {n_consumer} consumer and {n_ref_model} Ref. Model items")
+            self.failure += n_consumer + n_ref_model
+
+        if self.succes + self.failure == 0:
+            self.logger.error("No item was compared")
+            self.failure += 1
+
         assert self.failure == 0, f"the test found {self.failure} failed comparisons"
 
-    async def sample_ap_uvc(self, fifo, queue):
-        """ Copy FIFO content to internal queues.
+    async def drain_fifo(self, fifo, side):
+        """ Take the FIFO content and compare.
+        - Waits for the first item, then takes all the items already available without waiting.
+        """
+
+        add_item = self.append_item if self.matcher is None else self.match_item
+
+        while True:
+            add_item(await fifo.get(), side)
+
+            success, item = fifo.try_get()
+            while success:
+                add_item(item, side)
+                success, item = fifo.try_get()
+
+            if self.matcher is None:
+                self.uvc_ssdt_consumer_max_depth = max(self.uvc_ssdt_consumer_max_depth, len(self.uvc_ssdt_consumer_data))
+                self.ref_model_max_depth = max(self.ref_model_max_depth, len(self.ref_model_data))
+
+                self.compare()
+            else:
+                self.expire_items(1 - side)
+
+            self.update_objection()
+
+            if self.compared_target is not None and self.n_compared >= self.compared_target:
+                self.compared_event.set()
+
+    async def wait_compared(self, n_items):
+        """ Wait until 'n_items' pairs of items were compared, or the drain watchdog gave up.
+        """
+
+        if self.n_compared >= n_items:
+            return
+
+        self.compared_target = n_items
+        self.compared_event.clear()
+        await self.compared_event.wait()
+        self.compared_target = None
+
+    def update_objection(self):
+        """ Hold the run phase while items wait for their counterpart (raised/dropped on each change only).
+        """
+
+        if self.matcher is not None:
+            pending = any(self.matcher.n_pending)
+        else:
+            pending = self.uvc_ssdt_consumer_data or self.ref_model_data
+
+        if pending and not self.pending_objection:
+            self.raise_objection()
+            self.pending_objection = True
+            self.n_objections += 1
+        elif not pending and self.pending_objection:
+            self.drop_objection()
+            self.pending_objection = False
+
+    async def drain_watchdog(self, timeout):
+        """ Drop the objection when it was held for a whole 'timeout' clock cycles without any comparison.
+        - Wakes up once every 'timeout' clock cycles, so the objection is dropped after 1 to 2 times 'timeout'.
+        - The items left are reported by 'check_phase()'. New items raise the objection again.
         """
+
+        clk = self.cfg.ssdt_cons_cfg.vif.clk
+        n_compared, n_objections = self.n_compared, self.n_objections
+
         while True:
-            item = await fifo.get()
-            item.set_name(fifo.get_name())
+            await ClockCycles(clk, timeout)
+
+            if self.pending_objection and self.n_compared == n_compared and self.n_objections == n_objections:
+                self.logger.warning(f"No item compared for {timeout} clock cycles, not waiting for the items left")
+                self.drop_objection()
+                self.pending_objection = False
+                self.compared_event.set()
+
+            n_compared, n_objections = self.n_compared, self.n_objections
+
+    def append_item(self, item, side):
+        """ IN_ORDER: append the 'data' and 'time' of an item (or of a batch of items).
+        """
+        if side == _CONSUMER_:
+            data, times = self.uvc_ssdt_consumer_data, self.uvc_ssdt_consumer_time
+        else:
+            data, times = self.ref_model_data, self.ref_model_time
 
-            await queue.put(item)
-            self.logger.debug(f"sample_ap_uvc : {item} |")
+        if isinstance(item, uvc_ssdt_mon_batch):
+            data.extend(batch_item.data for batch_item in item)
+            times.extend(batch_item.time for batch_item in item)
+        else:
+            data.append(item.data)
+            times.append(item.time)
 
-    def print_scb(self):
-        """ Print queue items.
+    def compare(self):
+        """ IN_ORDER: compare the 'data' received on both sides, in order.
+        """
+        consumer_data = self.uvc_ssdt_consumer_data
+        ref_model_data = self.ref_model_data
+
+        while consumer_data and ref_model_data:
+            self.check_data(consumer_data.popleft(), ref_model_data.popleft())
+            self.check_latency(self.uvc_ssdt_consumer_time.popleft(), self.ref_model_time.popleft())
+
+    def match_item(self, item, side):
+        """ KEYED: match an item (or a batch of items) with the pending items of the other side.
+        """
+        items = item if isinstance(item, uvc_ssdt_mon_batch) else (item,)
+
+        for item in items:
+            other = self.matcher.add(side, self.key_fn(item), (item.data, item.time))
+
+            if other is not None:
+                if side == _CONSUMER_:
+                    self.check_data(item.data, other[0])
+                    self.check_latency(item.time, other[1])
+                else:
+                    self.check_data(other[0], item.data)
+                    self.check_latency(other[1], item.time)
+
+    def expire_items(self, side):
+        """ KEYED: fail the items of 'side' not matched within the window.
+        """
+        for key, (data, _) in self.matcher.expire(side):
+            name = "Consumer" if side == _CONSUMER_ else "Ref. Model"
+            self.logger.error(f"{name} item not matched within {self.matcher.window} items: key = {key}, data = {data}")
+            self.failure += 1
+
+    def check_data(self, consumer_value, ref_model_value):
+        """ Compare a pair of values and update result.
+        """
+
+        # Print items as they are compared (only in DEBUG level)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.print_scb(consumer_value, ref_model_value)
+
+        match = consumer_value == ref_model_value
+        self.n_compared += 1
+
+        if self.log_writer is not None:
+            self.log_writer.record(consumer_value, ref_model_value, match)
+
+        if match:
+            self.succes += 1
+        else:
+            self.logger.error(f"Items not identical: \n \
+                consumer data = {consumer_value}, \n \
+                Ref. Model data = {ref_model_value}")
+            self.failure += 1
+
+    def check_latency(self, consumer_time, ref_model_time):
+        """ Check the latency between the input (Ref. Model item) and the output (consumer item) of the DUT.
+        - The Ref. Model item keeps the time when the producer monitor sampled the input.
+        """
+
+        if self.cfg.clk_period is None:
+            return
+
+        latency = (consumer_time - ref_model_time) // self.cfg.clk_period
+        self.latency_histogram[min(max(latency, 0), _LATENCY_HIST_SIZE_ - 1)] += 1
+
+        if self.cfg.scb_latency is not None and latency != self.cfg.scb_latency:
+            self.logger.error(f"Wrong latency: {latency} clock cycles (expected {self.cfg.scb_latency}), \
+                input time = {ref_model_time}, output time = {consumer_time}")
+            self.failure += 1
+
+    def print_scb(self, consumer_value, ref_model_value):
+        """ Print compared values.
         """
         self.logger.debug(f"{'-'*35}")
         self.logger.debug(" | Consumer |   Ref    |")
-        self.logger.debug(f" |   {self.uvc_ssdt_consumer_item.data:4d}   |   {self.ref_model_item.data:4d}")
+        self.logger.debug(f" |   {consumer_value:4d}   |   {ref_model_value:4d}")
         self.logger.debug(f"{'-'*35}")
-        self.logger.debug(f" \n \
-                            | {self.uvc_ssdt_consumer_item}  |\n \
-                            |         {self.ref_model_item}  |")
-        self.logger.debug(f"{'-'*35}")
-
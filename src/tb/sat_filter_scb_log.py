@@ -0,0 +1,139 @@
+""" Saturation Filter Scoreboard log
+
+- Compact, columnar binary log of every comparison done by the scoreboard.
+- Layout: header (magic + byte order), then chunks of 'n' records:
+    'n' (uint32) | consumer data (n x uint64) | Ref. Model data (n x uint64) | match flag (n x uint8)
+- Standalone reader for post-mortem (no simulator nor pyuvm required). From the 'src/tb' directory:
+
+    python sat_filter_scb_log.py sim_build/<test>_scb.log --mismatches
+"""
+
+import argparse
+import struct
+import sys
+from array import array
+
+_MAGIC_ = b"SFSCBLOG"
+_BYTE_ORDERS_ = {"little": b"<", "big": b">"}
+_CHUNK_HEADER_ = struct.Struct("=I")
+
+# Number of records buffered before writing a chunk
+_CHUNK_SIZE_ = 65536
+
+
+class sat_filter_scb_log_writer():
+    """ Writer of the scoreboard log.
+    - The records are buffered in columns and written to the file one chunk at a time.
+    """
+
+    def __init__(self, path, chunk_size=_CHUNK_SIZE_):
+
+        self.path = path
+        self.chunk_size = chunk_size
+
+        self.consumer_data = array("Q")
+        self.ref_model_data = array("Q")
+        self.match = array("B")
+
+        # Summary
+        self.n_records = 0
+        self.n_mismatches = 0
+
+        self.file = open(path, "wb")
+        self.file.write(_MAGIC_ + _BYTE_ORDERS_[sys.byteorder])
+
+    def record(self, consumer_value, ref_model_value, match):
+        """ Record a comparison. """
+
+        self.consumer_data.append(consumer_value)
+        self.ref_model_data.append(ref_model_value)
+        self.match.append(match)
+
+        self.n_records += 1
+        if not match:
+            self.n_mismatches += 1
+
+        if len(self.match) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """ Write the buffered records as a chunk. """
+
+        if not self.match:
+            return
+
+        self.file.write(_CHUNK_HEADER_.pack(len(self.match)))
+        for column in (self.consumer_data, self.ref_model_data, self.match):
+            column.tofile(self.file)
+            del column[:]
+
+    def close(self):
+        """ Write the remaining records and close the file. """
+
+        if self.file.closed:
+            return
+
+        self.flush()
+        self.file.close()
+
+
+def sat_filter_scb_log_read(path):
+    """ Iterate over the chunks of a scoreboard log.
+    - Yields (consumer data, Ref. Model data, match) columns, as arrays.
+    """
+
+    with open(path, "rb") as f:
+
+        header = f.read(len(_MAGIC_) + 1)
+        if header[:len(_MAGIC_)] != _MAGIC_:
+            raise ValueError(f"'{path}' is not a scoreboard log")
+        swap = header[len(_MAGIC_):] != _BYTE_ORDERS_[sys.byteorder]
+
+        chunk_header_order = "<" if header[len(_MAGIC_):] == b"<" else ">"
+        chunk_header = struct.Struct(f"{chunk_header_order}I")
+
+        while raw := f.read(chunk_header.size):
+            n, = chunk_header.unpack(raw)
+
+            columns = []
+            for typecode in ("Q", "Q", "B"):
+                column = array(typecode)
+                column.fromfile(f, n)
+                if swap:
+                    column.byteswap()
+                columns.append(column)
+
+            yield tuple(columns)
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Summary and records of a Saturation Filter scoreboard log.")
+    parser.add_argument("path", help="scoreboard log file")
+    parser.add_argument("--mismatches", action="store_true", help="print the failed comparisons")
+    parser.add_argument("--all", action="store_true", help="print all the comparisons")
+    args = parser.parse_args()
+
+    n_records = 0
+    n_mismatches = 0
+
+    if args.mismatches or args.all:
+        print(f"{'Index':>12} | {'Consumer':>20} | {'Ref. Model':>20} | Match")
+
+    for consumer_data, ref_model_data, match in sat_filter_scb_log_read(args.path):
+
+        if args.mismatches or args.all:
+            for i, is_match in enumerate(match):
+                if args.all or not is_match:
+                    print(f"{n_records + i:>12} | {consumer_data[i]:>20} | {ref_model_data[i]:>20} | {bool(is_match)}")
+
+        n_records += len(match)
+        n_mismatches += len(match) - sum(match)
+
+    print(f"{args.path}: {n_records} comparisons, {n_records - n_mismatches} matches, {n_mismatches} mismatches")
+
+    return 1 if n_mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,6 +4,7 @@
 import os, warnings
 import cocotb
 from cocotb.triggers import RisingEdge, ReadOnly
+from cocotb.utils import get_sim_time
 import vsc
 
 from pyuvm import uvm_test, uvm_report_object, uvm_root
@@ -12,6 +13,7 @@ from sat_filter_tb_config import sat_filter_tb_config
 from sat_filter_tb_env import sat_filter_tb_env
 from sat_filter_tb_base_seq import sat_filter_tb_base_seq
 from sat_filter_coverage import sat_filter_coverage
+from sat_filter_tb_seed_manager import sat_filter_tb_seed_manager
 
 from uvc.ssdt.src.uvc_ssdt_interface import ssdt_interface_wrapper
 from uvc.ssdt.src.uvc_ssdt_interface_assertions import ssdt_interface_assert_check
@@ -57,6 +59,9 @@ class sat_filter_tb_base_test(uvm_test):
         # Saturation filter coverage - OVF
         self.sat_filter_cov = None
 
+        # Seed manager handler
+        self.seed_manager = None
+
         # Quick fix because of warnings og PYVSC
         warnings.simplefilter("ignore")
 
@@ -69,6 +74,22 @@ class sat_filter_tb_base_test(uvm_test):
         self.cfg = sat_filter_tb_config.create('sat_filter_base_cfg')
         self.cdb_set("cfg", self.cfg, "")
 
+        # Every agent (and its sequences) gets its own random stream, derived from the cocotb seed (RANDOM_SEED)
+        self.seed_manager = sat_filter_tb_seed_manager(cocotb.RANDOM_SEED)
+        self.logger.info(f"Master seed = {self.seed_manager.master_seed}")
+
+        self.cfg.ssdt_prod_cfg.seed = self.seed_manager.get_seed(self.cfg.ssdt_prod_cfg.get_name())
+        self.cfg.ssdt_cons_cfg.seed = self.seed_manager.get_seed(self.cfg.ssdt_cons_cfg.get_name())
+
+        _SIM_BUILD_FOLDER_ = os.getenv("SIM_BUILD", default="sim_build")
+
+        # Record the producer stimulus (SSDT_RECORD=1), so it can be re-driven by 'test_sat_filter_replay'
+        if os.getenv("SSDT_RECORD", default="0") == "1":
+            self.cfg.ssdt_prod_cfg.record_file = f'{_SIM_BUILD_FOLDER_}/{self.get_type_name()}_stimulus.log'
+
+        # Scoreboard comparisons log (read it with 'sat_filter_scb_log.py')
+        self.cfg.scb_log_file = f'{_SIM_BUILD_FOLDER_}/{self.get_type_name()}_scb.log'
+
         # Access the DUT through the cocotb.top handle
         self.dut = cocotb.top
 
@@ -147,6 +168,11 @@ class sat_filter_tb_base_test(uvm_test):
         self.cdb_set("virt_sequence", self.virt_sequence, "")
         self.logger.debug(f"Sequence {self.virt_sequence}.")
 
+        # Random stability of the (PyVSC) virtual sequence
+        if hasattr(self.virt_sequence, "set_randstate"):
+            seed = self.seed_manager.get_random(self.virt_sequence.get_name()).getrandbits(32)
+            self.virt_sequence.set_randstate(vsc.RandState.mkFromSeed(seed))
+
         # Clean inputs
         self.dut.in_data.value = 0
         self.dut.in_valid.value = 0
@@ -174,13 +200,24 @@ class sat_filter_tb_base_test(uvm_test):
 
         await RisingEdge(self.dut.clk)
         self.dut.rst.value = 1
+        reset_time = get_sim_time()
 
         await RisingEdge(self.dut.clk)
+        self.cfg.clk_period = get_sim_time() - reset_time
+        self.cfg.ssdt_prod_cfg.clk_period = self.cfg.clk_period
+        self.cfg.ssdt_cons_cfg.clk_period = self.cfg.clk_period
         await RisingEdge(self.dut.clk)
         self.dut.rst.value = 0
 
         self.logger.debug(f"Resetting DONE.")
 
+    async def wait_compared(self, n_items):
+        """ Wait until the scoreboard compared 'n_items' outputs.
+        - e.g. when the stimulus does not come from sequences, for the DUT pipeline to drain.
+        """
+
+        await self.tb_env.scoreboard.wait_compared(n_items)
+
     def setup_pyvsc_coverage_report(self):
 
         # Writing coverage report in (.txt format)
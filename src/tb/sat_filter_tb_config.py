@@ -1,8 +1,19 @@
 from pyuvm import uvm_object
+from enum import IntEnum
 
 from uvc.ssdt.src.uvc_ssdt_config import uvc_ssdt_config
 
 
+class sat_filter_scb_match_enum(IntEnum):
+    """ Matching strategy of the scoreboard: IN_ORDER or KEYED (out-of-order) """
+    IN_ORDER = 0
+    KEYED = 1
+
+class sat_filter_ref_model_pool_enum(IntEnum):
+    """ Worker pool of the reference model predictions: NONE (inline) or THREAD """
+    NONE = 0
+    THREAD = 1
+
 class sat_filter_tb_config(uvm_object):
 
     def __init__(self, name="cl_sdt_tb_config"):
@@ -12,9 +23,42 @@ class sat_filter_tb_config(uvm_object):
         self.data_width = None
         self.threshold = None
 
+        # Clock period, in simulator steps (measured by the test during the reset, and given to the agents)
+        self.clk_period = None
+
+        # Reference model: predict with a lookup table of 2**data_width entries, for data_width <= ref_model_lut_max_width
+        self.ref_model_lut = True
+        self.ref_model_lut_max_width = 16
+
+        # Reference model: run the predictions in a worker pool, overlapped with the simulation (takes precedence over the lookup table).
+        # At most 'ref_model_max_in_flight' jobs wait for their results (backpressure).
+        self.ref_model_pool = sat_filter_ref_model_pool_enum.NONE
+        self.ref_model_pool_workers = 2
+        self.ref_model_max_in_flight = 8
+
         self.ssdt_prod_cfg = uvc_ssdt_config.create("ssdt_prod_cfg")
         self.ssdt_cons_cfg = uvc_ssdt_config.create("ssdt_cons_cfg")
 
+        # Scoreboard matching strategy
+        self.scb_match_mode = sat_filter_scb_match_enum.IN_ORDER
+
+        # KEYED only (required): function returning the matching key of a transaction.
+        # It must give the same key to an input and to its output (e.g. a tag carried by the DUT).
+        self.scb_key_fn = None
+
+        # KEYED only: a pending item fails once more than 'scb_match_window' items arrived on the other side (0: no limit)
+        self.scb_match_window = 0
+
+        # Binary log of the scoreboard comparisons (see 'sat_filter_scb_log'). None disables it.
+        self.scb_log_file = None
+
+        # The scoreboard holds the run phase while items wait for their counterpart, unless no item was compared
+        # for 'scb_drain_timeout' clock cycles (0: no limit). The items left are then reported as errors.
+        self.scb_drain_timeout = 100
+
+        # Expected latency of the DUT, in clock cycles, checked by the scoreboard (None disables the check)
+        self.scb_latency = 1
+
     def build_phase(self):
 
         self.ssdt_prod_cfg.DATA_WIDTH = self.data_width
@@ -62,7 +62,7 @@ class sat_filter_tb_env(uvm_env):
         # Instantiate Reference Model
         self.logger.debug(f"Creating Reference Model...")
         self.ref_model_handler = sat_filter_ref_model.create("sat_filter_ref_model", self)
-        self.ref_model_handler.threshold = self.cfg.threshold
+        self.ref_model_handler.cdb_set("cfg", self.cfg, "")
         self.logger.debug(f"Reference Model < {self.ref_model_handler} > created")
 
         # Instantiate Agents
@@ -0,0 +1,27 @@
+""" Saturation Filter TB seed manager.
+
+- Derives an independent random stream for each agent and sequence from one master seed.
+- A stream only depends on the master seed and the name it is requested for, not on the order components run in.
+  Any run (or shard of a regression) is replayed by running it again with the same master seed.
+"""
+
+import random
+
+from uvc.ssdt.src.ssdt_common import ssdt_derive_seed
+
+
+class sat_filter_tb_seed_manager():
+    """ Seed manager for the Saturation Filter TB.
+    """
+
+    def __init__(self, master_seed):
+
+        self.master_seed = int(master_seed)
+
+    def get_seed(self, path) -> int:
+        """ Seed of the stream of 'path' (e.g. a component or sequence name). """
+        return ssdt_derive_seed(self.master_seed, path)
+
+    def get_random(self, path) -> random.Random:
+        """ Independent random stream of 'path'. """
+        return random.Random(self.get_seed(path))
@@ -1,11 +1,11 @@
 """ Basic cocotb test.
 """
-from random import randint
-
 import cocotb
 from cocotb.triggers import RisingEdge
 from cocotb.types import Logic, LogicArray
 
+from sat_filter_tb_seed_manager import sat_filter_tb_seed_manager
+
 async def reset(dut):
     """ Reset operation.
     """
@@ -83,13 +83,16 @@ async def test_rand_all(dut):
 
     await RisingEdge(dut.clk)
 
+    # Random stream of the test, derived from the cocotb seed (RANDOM_SEED)
+    rng = sat_filter_tb_seed_manager(cocotb.RANDOM_SEED).get_random("test_rand_all")
+
     dut_bit_w = dut.DATA_W.value
     max_value = 2**dut_bit_w-1
     cocotb.log.info(f"DATA_W = {dut_bit_w}, max_value = {max_value}")
 
     for _ in range(0,max_value*2):
-        dut.in_valid.value = randint(0,1)
-        dut.in_data.value = randint(0,max_value)
+        dut.in_valid.value = rng.randint(0,1)
+        dut.in_data.value = rng.randint(0,max_value)
         await RisingEdge(dut.clk)
         cocotb.log.info(f"IN_DATA = {dut.in_data.value.integer}")
 
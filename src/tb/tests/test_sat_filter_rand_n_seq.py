@@ -4,27 +4,43 @@ from pyuvm import uvm_factory
 
 from sat_filter_tb_base_test import sat_filter_tb_base_test
 from sat_filter_tb_base_seq import sat_filter_tb_base_seq
+from sat_filter_tb_config import sat_filter_scb_match_enum, sat_filter_ref_model_pool_enum
 from vseqs.sat_filter_rand_n_seq import sat_filter_rand_n_seq
+from uvc.ssdt.src.uvc_ssdt_rand_backend import uvc_ssdt_rand_backend_enum
 
 # Default values
 _TIMEOUT_TIME = 1000
 _TIMEOUT_UNIT = 'ns'
 
 _MAX_SEQS_NUMBER_ = 105   # You can change this value
+_MATCH_WINDOW_ = 8        # You can change this value
+_MON_POOL_SIZE_ = 16      # You can change this value
+_MON_BATCH_SIZE_ = 4      # You can change this value
+_MON_BATCH_WINDOW_ = 8    # You can change this value
 
 # ---------------------------------------------------------------------------------------------
-# Test launching the 'sat_filter_rand_n_seq' sequence
+# Base test launching the 'sat_filter_rand_n_seq' sequence. Not registered: each variant below
+# only overrides 'set_config()'.
 # ---------------------------------------------------------------------------------------------
-@pyuvm.test(timeout_time=_TIMEOUT_TIME, timeout_unit=_TIMEOUT_UNIT)
-class test_sat_filter_rand_n_seq(sat_filter_tb_base_test):
+class test_sat_filter_rand_n_seq_base(sat_filter_tb_base_test):
     """ Test that launches the 'sat_filter_rand_n_seq' sequence:
+    - Apply the configuration of the variant ('set_config()')
     - Randomize the sequence to set the number of tierations
     - Start the virtual sequence to generate the data traffic.
     """
 
-    def __init__(self, name="test_sat_filter_sat_filter_rand_n_seq", parent=None):
+    # Mode of the virtual sequence
+    PER_ITEM_SEQS = False
 
-        super().__init__(name, parent)
+    def build_phase(self):
+
+        super().build_phase()
+        self.set_config()
+
+    def set_config(self):
+        """ Configuration hook of the variants, called at the end of 'build_phase'.
+        """
+        pass
 
     def start_of_simulation_phase(self):
 
@@ -43,9 +59,173 @@ class test_sat_filter_rand_n_seq(sat_filter_tb_base_test):
         with self.virt_sequence.randomize_with() as seq:
             seq.number_of_seqs == _MAX_SEQS_NUMBER_
 
+        self.virt_sequence.per_item_seqs = self.PER_ITEM_SEQS
+
         # Start sequence
         await (self.virt_sequence.start(self.tb_env.virtual_sequencer))
 
         self.drop_objection()
 
         self.logger.info(f"{'-'*30} END 'run_phase' of <{self.__class__.__name__}> {'-'*30}")
+
+
+@pyuvm.test(timeout_time=_TIMEOUT_TIME, timeout_unit=_TIMEOUT_UNIT)
+class test_sat_filter_rand_n_seq(test_sat_filter_rand_n_seq_base):
+    """ Default configuration. """
+
+    def __init__(self, name="test_sat_filter_sat_filter_rand_n_seq", parent=None):
+
+        super().__init__(name, parent)
+
+
+@pyuvm.test(timeout_time=_TIMEOUT_TIME, timeout_unit=_TIMEOUT_UNIT)
+class test_sat_filter_burst_rand_n_seq(test_sat_filter_rand_n_seq_base):
+    """ Producer driver in burst mode (one item per clock). """
+
+    def __init__(self, name="test_sat_filter_burst_rand_n_seq", parent=None):
+
+        super().__init__(name, parent)
+
+    def set_config(self):
+
+        # Keep 'valid' high across back-to-back items
+        self.cfg.ssdt_prod_cfg.burst_mode = True
+
+
+@pyuvm.test(timeout_time=_TIMEOUT_TIME, timeout_unit=_TIMEOUT_UNIT)
+class test_sat_filter_keyed_rand_n_seq(test_sat_filter_rand_n_seq_base):
+    """ KEYED scoreboard, items matched by output value within a window. """
+
+    def __init__(self, name="test_sat_filter_keyed_rand_n_seq", parent=None):
+
+        super().__init__(name, parent)
+
+    def set_config(self):
+
+        # The DUT carries no tag: the key is the output value, items with the same value are matched in
+        # arrival order. A missing or extra output is left unmatched, and fails once the window is over.
+        self.cfg.scb_match_mode = sat_filter_scb_match_enum.KEYED
+        self.cfg.scb_key_fn = lambda item: item.data
+        self.cfg.scb_match_window = _MATCH_WINDOW_
+
+
+@pyuvm.test(timeout_time=_TIMEOUT_TIME, timeout_unit=_TIMEOUT_UNIT)
+class test_sat_filter_ref_model_pool_rand_n_seq(test_sat_filter_rand_n_seq_base):
+    """ Ref. Model predictions in a thread pool, published in order. """
+
+    def __init__(self, name="test_sat_filter_ref_model_pool_rand_n_seq", parent=None):
+
+        super().__init__(name, parent)
+
+    def set_config(self):
+
+        # Predictions overlapped with the simulation
+        self.cfg.ref_model_pool = sat_filter_ref_model_pool_enum.THREAD
+
+
+@pyuvm.test(timeout_time=_TIMEOUT_TIME, timeout_unit=_TIMEOUT_UNIT)
+class test_sat_filter_no_rsp_rand_n_seq(test_sat_filter_rand_n_seq_base):
+    """ Responses disabled on both agents, a single stream sequence per agent. """
+
+    def __init__(self, name="test_sat_filter_no_rsp_rand_n_seq", parent=None):
+
+        super().__init__(name, parent)
+
+    def set_config(self):
+
+        # The drivers update the requests in place, no 'put_response()'/'get_response()'
+        self.cfg.ssdt_prod_cfg.response_enable = False
+        self.cfg.ssdt_cons_cfg.response_enable = False
+
+
+@pyuvm.test(timeout_time=_TIMEOUT_TIME, timeout_unit=_TIMEOUT_UNIT)
+class test_sat_filter_no_rsp_per_item_rand_n_seq(test_sat_filter_rand_n_seq_base):
+    """ Responses disabled on both agents, a sequence per item (recycled items). """
+
+    PER_ITEM_SEQS = True
+
+    def __init__(self, name="test_sat_filter_no_rsp_per_item_rand_n_seq", parent=None):
+
+        super().__init__(name, parent)
+
+    def set_config(self):
+
+        self.cfg.ssdt_prod_cfg.response_enable = False
+        self.cfg.ssdt_cons_cfg.response_enable = False
+
+
+@pyuvm.test(timeout_time=_TIMEOUT_TIME, timeout_unit=_TIMEOUT_UNIT)
+class test_sat_filter_mon_pool_batch_rand_n_seq(test_sat_filter_rand_n_seq_base):
+    """ Monitors recycling their transactions and publishing them in batches. """
+
+    def __init__(self, name="test_sat_filter_mon_pool_batch_rand_n_seq", parent=None):
+
+        super().__init__(name, parent)
+
+    def set_config(self):
+
+        # The pool is bigger than a batch, the last batch is published by its time window
+        for agent_cfg in (self.cfg.ssdt_prod_cfg, self.cfg.ssdt_cons_cfg):
+            agent_cfg.mon_pool_size = _MON_POOL_SIZE_
+            agent_cfg.mon_batch_size = _MON_BATCH_SIZE_
+            agent_cfg.mon_batch_window = _MON_BATCH_WINDOW_
+
+
+@pyuvm.test(timeout_time=_TIMEOUT_TIME, timeout_unit=_TIMEOUT_UNIT)
+class test_sat_filter_mon_idle_skip_rand_n_seq(test_sat_filter_rand_n_seq_base):
+    """ Monitors sleeping over idle cycles, with the batch time window counted across them. """
+
+    def __init__(self, name="test_sat_filter_mon_idle_skip_rand_n_seq", parent=None):
+
+        super().__init__(name, parent)
+
+    def set_config(self):
+
+        for agent_cfg in (self.cfg.ssdt_prod_cfg, self.cfg.ssdt_cons_cfg):
+            agent_cfg.mon_idle_skip = True
+            agent_cfg.mon_batch_size = _MON_BATCH_SIZE_
+            agent_cfg.mon_batch_window = _MON_BATCH_WINDOW_
+
+
+@pyuvm.test(timeout_time=_TIMEOUT_TIME, timeout_unit=_TIMEOUT_UNIT)
+class test_sat_filter_ref_model_pool_backpressure_rand_n_seq(test_sat_filter_rand_n_seq_base):
+    """ Ref. Model thread pool under backpressure, fed by a producer monitor recycling its items. """
+
+    def __init__(self, name="test_sat_filter_ref_model_pool_backpressure_rand_n_seq", parent=None):
+
+        super().__init__(name, parent)
+
+    def set_config(self):
+
+        # A single job in flight, while the monitor recycles each item two beats later
+        self.cfg.ref_model_pool = sat_filter_ref_model_pool_enum.THREAD
+        self.cfg.ref_model_max_in_flight = 1
+        self.cfg.ssdt_prod_cfg.mon_pool_size = 2
+
+
+@pyuvm.test(timeout_time=_TIMEOUT_TIME, timeout_unit=_TIMEOUT_UNIT)
+class test_sat_filter_native_rand_n_seq(test_sat_filter_rand_n_seq_base):
+    """ 'data' drawn by the NATIVE randomization backend (seeded PRNG). """
+
+    def __init__(self, name="test_sat_filter_native_rand_n_seq", parent=None):
+
+        super().__init__(name, parent)
+
+    def set_config(self):
+
+        self.cfg.ssdt_prod_cfg.rand_backend = uvc_ssdt_rand_backend_enum.NATIVE
+        self.cfg.ssdt_cons_cfg.rand_backend = uvc_ssdt_rand_backend_enum.NATIVE
+
+
+@pyuvm.test(timeout_time=_TIMEOUT_TIME, timeout_unit=_TIMEOUT_UNIT)
+class test_sat_filter_constrainedrandom_rand_n_seq(test_sat_filter_rand_n_seq_base):
+    """ 'data' drawn by the CONSTRAINEDRANDOM randomization backend. """
+
+    def __init__(self, name="test_sat_filter_constrainedrandom_rand_n_seq", parent=None):
+
+        super().__init__(name, parent)
+
+    def set_config(self):
+
+        self.cfg.ssdt_prod_cfg.rand_backend = uvc_ssdt_rand_backend_enum.CONSTRAINEDRANDOM
+        self.cfg.ssdt_cons_cfg.rand_backend = uvc_ssdt_rand_backend_enum.CONSTRAINEDRANDOM
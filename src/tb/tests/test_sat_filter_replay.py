@@ -0,0 +1,47 @@
+import os
+import cocotb
+import pyuvm
+
+from sat_filter_tb_base_test import sat_filter_tb_base_test
+
+# Default values
+_TIMEOUT_TIME = 1000
+_TIMEOUT_UNIT = 'ns'
+
+# Stimulus log to replay (recorded by any test run with SSDT_RECORD=1)
+_REPLAY_FILE_ = os.getenv("SSDT_REPLAY_FILE")
+
+# ---------------------------------------------------------------------------------------------
+# Test re-driving a recorded stimulus log
+# ---------------------------------------------------------------------------------------------
+@pyuvm.test(timeout_time=_TIMEOUT_TIME, timeout_unit=_TIMEOUT_UNIT, skip=_REPLAY_FILE_ is None)
+class test_sat_filter_replay(sat_filter_tb_base_test):
+    """ Test that re-drives the producer stimulus of a previous run, bit-exactly:
+    - Record a run with 'make SSDT_RECORD=1 TESTCASE=<test>' (log in 'sim_build/<test>_stimulus.log').
+    - Replay it with 'make SSDT_REPLAY_FILE=<log> TESTCASE=test_sat_filter_replay'.
+    - No sequence is started, so the constraints are not solved again.
+    """
+
+    def __init__(self, name="test_sat_filter_replay", parent=None):
+
+        super().__init__(name, parent)
+
+    async def run_phase(self):
+
+        self.logger.info(f"{'-'*30} Running test <{self.__class__.__name__}> {'-'*30}")
+
+        self.raise_objection()
+
+        # The log timing is relative to the start of the run phase, reset included
+        replay_task = cocotb.start_soon(self.tb_env.uvc_ssdt_producer.driver.log_replay_loop(_REPLAY_FILE_))
+
+        await super().run_phase()
+
+        n_beats = await replay_task
+
+        # The replay returns after the last beat: wait for all of them to come out of the DUT
+        await self.wait_compared(n_beats)
+
+        self.drop_objection()
+
+        self.logger.info(f"{'-'*30} END 'run_phase' of <{self.__class__.__name__}> {'-'*30}")
@@ -0,0 +1,84 @@
+import pyuvm
+
+from cocotb.triggers import RisingEdge
+
+from sat_filter_tb_base_test import sat_filter_tb_base_test
+from sat_filter_tb_config import sat_filter_scb_match_enum
+from uvc.ssdt.src.uvc_ssdt_mon_item import uvc_ssdt_mon_item
+
+# Default values
+_TIMEOUT_TIME = 1000
+_TIMEOUT_UNIT = 'ns'
+
+_N_ITEMS_ = 32          # You can change this value
+_REORDER_BLOCK_ = 4     # Outputs are reversed within blocks of this size
+_MATCH_WINDOW_ = 8      # Must cover the reordering
+
+# ---------------------------------------------------------------------------------------------
+# Test of the KEYED scoreboard with outputs out of order
+# ---------------------------------------------------------------------------------------------
+@pyuvm.test(timeout_time=_TIMEOUT_TIME, timeout_unit=_TIMEOUT_UNIT)
+class test_sat_filter_scb_keyed_reorder(sat_filter_tb_base_test):
+    """ Test that feeds the scoreboard with outputs reordered with respect to their inputs:
+    - Each pair of items carries the same tag ('tr_id'), used as the matching key.
+    - The outputs are reversed within blocks, and every other block arrives before its inputs.
+    - The DUT stays idle, the items are written directly to the scoreboard FIFOs.
+    """
+
+    def __init__(self, name="test_sat_filter_scb_keyed_reorder", parent=None):
+
+        super().__init__(name, parent)
+
+    def build_phase(self):
+
+        super().build_phase()
+
+        self.cfg.scb_match_mode = sat_filter_scb_match_enum.KEYED
+        self.cfg.scb_match_window = _MATCH_WINDOW_
+        self.cfg.scb_key_fn = lambda item: item.tr_id
+
+    async def run_phase(self):
+
+        self.logger.info(f"{'-'*30} Running test <{self.__class__.__name__}> {'-'*30}")
+
+        self.raise_objection()
+
+        await super().run_phase()
+
+        scoreboard = self.tb_env.scoreboard
+        ref_model_export = scoreboard.ref_model_fifo.analysis_export
+        consumer_export = scoreboard.uvc_ssdt_consumer_fifo.analysis_export
+
+        max_value = 2**self.cfg.data_width-1
+        latency = self.cfg.clk_period * (self.cfg.scb_latency or 0)
+
+        for block in range(0, _N_ITEMS_, _REORDER_BLOCK_):
+            tags = range(block, min(block + _REORDER_BLOCK_, _N_ITEMS_))
+
+            # Same 'data' for both sides, the output 'time' is one DUT latency after the input
+            inputs = [uvc_ssdt_mon_item("ref_model_item", tag % (max_value+1), tag, tag*self.cfg.clk_period) for tag in tags]
+            outputs = [uvc_ssdt_mon_item("consumer_item", item.data, item.tr_id, item.time + latency) for item in reversed(inputs)]
+
+            if (block // _REORDER_BLOCK_) % 2 == 0:
+                writes = ((ref_model_export, inputs), (consumer_export, outputs))
+            else:
+                writes = ((consumer_export, outputs), (ref_model_export, inputs))
+
+            for export, items in writes:
+                for item in items:
+                    export.write(item)
+                await RisingEdge(self.dut.clk)
+
+        await self.wait_compared(_N_ITEMS_)
+
+        self.drop_objection()
+
+        self.logger.info(f"{'-'*30} END 'run_phase' of <{self.__class__.__name__}> {'-'*30}")
+
+    def report_phase(self):
+
+        super().report_phase()
+
+        # Every pair was matched despite the reordering (mismatches fail in the scoreboard)
+        assert self.tb_env.scoreboard.n_compared == _N_ITEMS_, \
+            f"{self.tb_env.scoreboard.n_compared} pairs compared, expected {_N_ITEMS_}"
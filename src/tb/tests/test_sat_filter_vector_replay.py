@@ -0,0 +1,98 @@
+import os
+import pyuvm
+
+from array import array
+
+from sat_filter_tb_base_test import sat_filter_tb_base_test
+from uvc.ssdt.src.uvc_ssdt_stimulus_file import uvc_ssdt_stimulus_file
+
+# Default values
+_TIMEOUT_TIME = 1000
+_TIMEOUT_UNIT = 'ns'
+
+_SWEEP_REPETITIONS_ = 4   # You can change this value
+
+# ---------------------------------------------------------------------------------------------
+# Test replaying a pre-built stimulus buffer on the producer driver
+# ---------------------------------------------------------------------------------------------
+@pyuvm.test(timeout_time=_TIMEOUT_TIME, timeout_unit=_TIMEOUT_UNIT)
+class test_sat_filter_vector_replay(sat_filter_tb_base_test):
+    """ Test that replays a directed sweep without sequences:
+    - Build a buffer sweeping all the 'data' values, with an idle cycle after each full sweep.
+    - Replay it on the producer driver, one entry per clock.
+    """
+
+    def __init__(self, name="test_sat_filter_vector_replay", parent=None):
+
+        super().__init__(name, parent)
+
+    async def run_phase(self):
+
+        self.logger.info(f"{'-'*30} Running test <{self.__class__.__name__}> {'-'*30}")
+
+        self.raise_objection()
+
+        await super().run_phase()
+
+        # Build stimulus: [0:max_value] sweeps, followed by an idle cycle
+        max_value = 2**self.cfg.data_width-1
+
+        data = array('Q')
+        valid = array('B')
+        for _ in range(0, _SWEEP_REPETITIONS_):
+            data.extend(range(0, max_value+1))
+            valid.extend([1]*(max_value+1))
+            data.append(0)
+            valid.append(0)
+
+        # Replay stimulus
+        await self.tb_env.uvc_ssdt_producer.driver.vector_replay_loop(data, valid)
+
+        self.drop_objection()
+
+        self.logger.info(f"{'-'*30} END 'run_phase' of <{self.__class__.__name__}> {'-'*30}")
+
+
+# ---------------------------------------------------------------------------------------------
+# Test replaying a memory-mapped stimulus file on the producer driver
+# ---------------------------------------------------------------------------------------------
+@pyuvm.test(timeout_time=_TIMEOUT_TIME, timeout_unit=_TIMEOUT_UNIT)
+class test_sat_filter_vector_replay_file(sat_filter_tb_base_test):
+    """ Test that replays a directed sweep from a stimulus file:
+    - Write the sweep (with its idle cycles) to a binary file with a 'valid' column.
+    - Memory-map the file and replay it on the producer driver, one entry per clock.
+    """
+
+    def __init__(self, name="test_sat_filter_vector_replay_file", parent=None):
+
+        super().__init__(name, parent)
+
+    async def run_phase(self):
+
+        self.logger.info(f"{'-'*30} Running test <{self.__class__.__name__}> {'-'*30}")
+
+        self.raise_objection()
+
+        await super().run_phase()
+
+        # Build stimulus file: [0:max_value] sweeps, followed by an idle cycle
+        max_value = 2**self.cfg.data_width-1
+
+        data = array('Q')
+        valid = array('B')
+        for _ in range(0, _SWEEP_REPETITIONS_):
+            data.extend(range(0, max_value+1))
+            valid.extend([1]*(max_value+1))
+            data.append(0)
+            valid.append(0)
+
+        filename = f'{os.getenv("SIM_BUILD", default="sim_build")}/{self.get_type_name()}_stimulus.bin'
+        uvc_ssdt_stimulus_file.write(filename, data, valid)
+
+        # Replay stimulus file
+        with uvc_ssdt_stimulus_file(filename, with_valid=True) as stimulus:
+            await self.tb_env.uvc_ssdt_producer.driver.vector_replay_loop(stimulus.data, stimulus.valid)
+
+        self.drop_objection()
+
+        self.logger.info(f"{'-'*30} END 'run_phase' of <{self.__class__.__name__}> {'-'*30}")
@@ -1,16 +1,31 @@
+import hashlib
 import vsc
 from uvc.ssdt.src.uvc_ssdt_seq_item import uvc_ssdt_seq_item
 
+# Override classes already generated, per data width
+_ssdt_seq_item_override_classes = {}
+
 
 def ssdt_seq_item_override(data_w = 0):
     """ Method to be used by the UVM Factory, to override sequence item parameters.
     This is a cheat way to apply the constraints over the created sequence item.
+    The classes are cached per data width, so PyVSC elaborates each of them only once.
     """
+    data_w = int(data_w)
+
+    if data_w in _ssdt_seq_item_override_classes:
+        return _ssdt_seq_item_override_classes[data_w]
+
     @vsc.randobj
     class ssdt_seq_item_updated(uvc_ssdt_seq_item):
         """ Cheat class to apply constraints using UVM Factory.
         """
 
+        # Range of 'data', used both by the constraint below and by the solver-less paths
+        DATA_MIN = 1
+        DATA_MAX = 2**(data_w)-1
+        DATA_RANGE_ONLY = True
+
         def __init__(self, name = "ssdt_seq_item_updated"):
             super().__init__(name)
 
@@ -18,7 +33,17 @@ def ssdt_seq_item_override(data_w = 0):
         def ssdt_parameters_update(self):
             """Setting the correct DATA_WIDTH parameter"""
             self.SSDT_DATA_W == data_w
-            self.data > 0
-            self.data <= 2**(data_w)-1
+            self.data >= self.DATA_MIN
+            self.data <= self.DATA_MAX
 
-    return ssdt_seq_item_updated
\ No newline at end of file
+    _ssdt_seq_item_override_classes[data_w] = ssdt_seq_item_updated
+
+    return ssdt_seq_item_updated
+
+
+def ssdt_derive_seed(seed, path) -> int:
+    """ Derive an independent seed for 'path' (e.g. a component or sequence name) from 'seed'.
+    The result only depends on both values, not on the order it is called in.
+    """
+    digest = hashlib.sha256(f"{seed}:{path}".encode()).digest()
+    return int.from_bytes(digest[:8], "little")
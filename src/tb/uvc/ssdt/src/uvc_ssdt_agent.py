@@ -61,10 +61,13 @@ class uvc_ssdt_agent(uvm_agent):
             # Instantiate Sequencer and pass handler to ConfigDB
             self.logger.debug(f"Creating Sequencer...")
             self.sequencer = uvm_sequencer.create(f"{self.get_name()}_sequencer", self)
+            self.sequencer.cfg = self.cfg   # Gives sequences access to the agent configuration
             self.logger.debug(f"Sequencer created.")
 
-        # This will apply the agent configurations needed to the sequence item
-        uvm_factory().set_type_override_by_type(uvc_ssdt_seq_item, ssdt_seq_item_override(self.cfg.DATA_WIDTH))
+        # This will apply the agent configurations needed to the sequence items created by its sequences.
+        # Instance override, so agents with different configurations do not override each other.
+        seq_item_override = ssdt_seq_item_override(self.cfg.DATA_WIDTH)
+        uvm_factory().set_inst_override_by_type(uvc_ssdt_seq_item, seq_item_override, f"{self.get_full_name()}.*")
 
         # Create instance of Monitor and pass handle to ConfigDB
         self.logger.debug(f"Creating Monitor...")
@@ -1,5 +1,6 @@
 from pyuvm import uvm_object
 from enum import IntEnum
+from .uvc_ssdt_rand_backend import uvc_ssdt_rand_backend_enum
 
 
 class uvc_ssdt_type_enum(IntEnum):
@@ -29,4 +30,48 @@ class uvc_ssdt_config(uvm_object):
         self.driver_type = None
 
         # Set 'data' field width
-        self.DATA_WIDTH = None
\ No newline at end of file
+        self.DATA_WIDTH = None
+
+        # Randomization backend used by the sequences: PYVSC, CONSTRAINEDRANDOM or NATIVE
+        self.rand_backend = uvc_ssdt_rand_backend_enum.PYVSC
+
+        # Seed of the agent. Each sequence derives its own random stream from it.
+        # None: the sequences use the global random state.
+        self.seed = None
+
+        #############################
+        # Driver configuration
+        #############################
+
+        # PRODUCER only: prefetch the next item while the current one is on the bus
+        # and keep 'valid' high across back-to-back items (one item per clock).
+        self.burst_mode = False
+
+        # When False, the driver does not clone the request nor put a response.
+        # The request object is updated in place and recycled by the sequences.
+        self.response_enable = True
+
+        # PRODUCER only: path of the stimulus log where the driven beats (and idle gaps) are recorded.
+        # The log can be re-driven with 'uvc_ssdt_driver.log_replay_loop()'. None disables the recording.
+        self.record_file = None
+
+        #############################
+        # Monitor configuration
+        #############################
+
+        # Number of transactions recycled by the monitor in a ring (0 disables pooling).
+        # Subscribers must not keep a transaction for longer than 'mon_pool_size' beats.
+        # With batches, it must be higher than 'mon_batch_size'.
+        self.mon_pool_size = 0
+
+        # Publish the transactions in batches of 'mon_batch_size' beats (0 publishes each beat).
+        # A partial batch is published 'mon_batch_window' clock cycles after its first beat (0 disables it).
+        self.mon_batch_size = 0
+        self.mon_batch_window = 0
+
+        # Sleep while 'valid' is low instead of sampling every clock ('valid' must be synchronous to 'clk').
+        self.mon_idle_skip = False
+
+        # Clock period, in simulator steps, given by the test bench.
+        # Needed by 'mon_idle_skip' with 'mon_batch_window', to count the clock cycles slept.
+        self.clk_period = None
\ No newline at end of file
@@ -3,7 +3,7 @@
 
 import vsc
 from pyuvm import uvm_subscriber
-from .uvc_ssdt_seq_item import uvc_ssdt_seq_item
+from .uvc_ssdt_mon_item import uvc_ssdt_mon_item, uvc_ssdt_mon_batch
 
 
 class uvc_ssdt_coverage(uvm_subscriber):
@@ -24,12 +24,23 @@ class uvc_ssdt_coverage(uvm_subscriber):
         self.cg_ssdt = covergroup_ssdt(f"{self.get_full_name()}.cg_ssdt", self.cfg.DATA_WIDTH)
 
     # "write" method to sample the covergroups
-    def write(self, item: uvc_ssdt_seq_item):
+    def write(self, item: uvc_ssdt_mon_item):
         """Sampling method"""
 
+        if isinstance(item, uvc_ssdt_mon_batch):
+            self.write_batch(item)
+            return
+
         self.logger.debug(f"SSDT_Coverage received {item}")
         self.cg_ssdt.sample(item.data)
 
+    def write_batch(self, batch: uvc_ssdt_mon_batch):
+        """Sampling method for a batch of transactions"""
+
+        self.logger.debug(f"SSDT_Coverage received a batch of {len(batch)} transactions")
+        for item in batch:
+            self.cg_ssdt.sample(item.data)
+
 
 # Covergroup class
 @vsc.covergroup
@@ -4,9 +4,11 @@
 - Transaction level objects are obtained from the Sequencer and the UVM Driver drives them to the design via an interface handler, and vice-versa.
 """
 
+import cocotb
 from pyuvm import uvm_driver
-from cocotb.triggers import RisingEdge, ReadOnly
+from cocotb.triggers import RisingEdge, ReadOnly, ClockCycles
 from .uvc_ssdt_config import uvc_ssdt_type_enum
+from .uvc_ssdt_stimulus_file import uvc_ssdt_stimulus_log, uvc_ssdt_stimulus_recorder
 
 class uvc_ssdt_driver(uvm_driver):
     """ Driver for the SSDT-UVC.
@@ -20,6 +22,7 @@ class uvc_ssdt_driver(uvm_driver):
         # Declaration of components
         self.cfg = None         # Configuration object
         self.vif = None         # Virtual interface object
+        self.recorder = None    # Stimulus log recorder
 
     def build_phase(self):
 
@@ -39,6 +42,15 @@ class uvc_ssdt_driver(uvm_driver):
 
         self.logger.info("Running driver...")
 
+        # Record the driven beats, whatever loop drives them
+        if self.cfg.record_file is not None and self.cfg.driver_type is uvc_ssdt_type_enum.PRODUCER:
+            self.recorder = uvc_ssdt_stimulus_recorder(self.cfg.record_file)
+            cocotb.start_soon(self.record_loop())
+
+        # Burst mode replaces the per-item round trip below
+        if self.cfg.burst_mode and self.cfg.driver_type is uvc_ssdt_type_enum.PRODUCER:
+            await self.burst_producer_loop()
+
         while True:
             self.logger.debug(f"{'='*50}")
 
@@ -49,10 +61,7 @@ class uvc_ssdt_driver(uvm_driver):
             self.logger.debug(f"{'-'*50}")
 
             # 2. Once it get the transaction from the sequencer, clones it
-            self.rsp = self.req.clone()     # creates clone of seq item
-            self.rsp.set_context(self.req)  # Set response_id. Link a new response transaction to the request transaction.
-            self.rsp.set_id_info(self.req)
-            # TODO: Explain this... Why context is not enought?
+            self.create_response()
 
             # 3. Drive transaction
             self.logger.debug("...Driving pins...")
@@ -61,9 +70,32 @@ class uvc_ssdt_driver(uvm_driver):
             self.seq_item_port.item_done()
             self.logger.debug("item_done()")
 
-            self.logger.debug(f"Putting response: {self.rsp}")
-            self.seq_item_port.put_response(self.rsp)
-            self.logger.debug("Response put.")
+            self.send_response()
+
+    def create_response(self):
+        """ Create the response for the current request.
+        - When responses are disabled, the request object itself is updated and recycled by the sequence.
+        """
+
+        if not self.cfg.response_enable:
+            self.rsp = self.req
+            return
+
+        self.rsp = self.req.clone()     # creates clone of seq item
+        self.rsp.set_context(self.req)  # Set response_id. Link a new response transaction to the request transaction.
+        self.rsp.set_id_info(self.req)
+        # TODO: Explain this... Why context is not enought?
+
+    def send_response(self):
+        """ Put the response of the current request (only when responses are enabled).
+        """
+
+        if not self.cfg.response_enable:
+            return
+
+        self.logger.debug(f"Putting response: {self.rsp}")
+        self.seq_item_port.put_response(self.rsp)
+        self.logger.debug("Response put.")
 
     async def drive_transaction(self):
 
@@ -89,20 +121,156 @@ class uvc_ssdt_driver(uvm_driver):
         self.reset_bus()
         self.logger.debug(f"PRODUCER (rsp): data = {self.rsp.data}")
 
+    async def vector_replay_loop(self, data, valid=None):
+        """ PRODUCER loop replaying a pre-built stimulus buffer, one entry per clock.
+        - 'data' and 'valid' can be any indexable buffer (list, array('Q'), memoryview, NumPy array, ...).
+        - Without 'valid', every entry is a valid beat.
+        - The sequencer is not used, so no sequence should be running on this driver meanwhile.
+        """
+
+        if valid is not None and len(valid) != len(data):
+            raise ValueError(f"'data' ({len(data)}) and 'valid' ({len(valid)}) buffers must have the same length")
+
+        self.logger.debug(f"Replaying {len(data)} stimulus vectors...")
+
+        clk_edge = RisingEdge(self.vif.clk)
+        data_signal = self.vif.data
+        valid_signal = self.vif.valid
+
+        if valid is None:
+            valid_signal.value = 1
+            for value in data:
+                data_signal.value = int(value)
+                await clk_edge
+        else:
+            for value, is_valid in zip(data, valid):
+                # Idle cycles drive the same values as reset_bus()
+                if is_valid:
+                    data_signal.value = int(value)
+                    valid_signal.value = 1
+                else:
+                    data_signal.value = 0
+                    valid_signal.value = 0
+                await clk_edge
+
+        self.reset_bus()
+        self.logger.debug("Stimulus vectors replayed.")
+
+    async def record_loop(self):
+        """ Record the beats on the bus in a stimulus log (see 'uvc_ssdt_stimulus_recorder').
+        - The bus is sampled at each clock edge, as the DUT does, so the log is bit-exact whatever loop drove it.
+        - The gaps are counted from the start of the run phase.
+        """
+
+        self.logger.info(f"Recording driven beats in '{self.cfg.record_file}'")
+
+        clk_edge = RisingEdge(self.vif.clk)
+        gap = 0
+
+        while True:
+            await clk_edge
+
+            if self.vif.valid_is_high():
+                self.recorder.record(gap, self.vif.data.value.integer)
+                gap = 0
+            else:
+                gap += 1
+
+    async def log_replay_loop(self, path):
+        """ PRODUCER loop re-driving a stimulus log recorded by 'record_loop()'.
+        - Start it at the beginning of the run phase to get the recorded timing back.
+        - Neither the sequencer nor the randomization is used.
+        - Returns after the last beat was driven, with the number of beats. The DUT may still be processing them.
+        """
+
+        with uvc_ssdt_stimulus_log(path) as log:
+
+            n_beats = len(log)
+            self.logger.info(f"Replaying {n_beats} beats from '{path}'...")
+
+            clk_edge = RisingEdge(self.vif.clk)
+            data_signal = self.vif.data
+            valid_signal = self.vif.valid
+
+            for gap, value in log:
+                if gap:
+                    self.reset_bus()
+                    await ClockCycles(self.vif.clk, gap)
+
+                data_signal.value = value
+                valid_signal.value = 1
+                await clk_edge
+
+        self.reset_bus()
+        self.logger.info("Stimulus log replayed.")
+
+        return n_beats
+
+    async def burst_producer_loop(self):
+        """ PRODUCER loop for burst mode.
+        - The next item is prefetched while the current one is on the bus.
+        - 'valid' is kept high across back-to-back items, so the link runs at one item per clock.
+        - 'valid' is only deasserted when no item is ready at the clock edge.
+        - NOTE: item_done() and the response are given when the item is put on the bus, not when it is sampled.
+        """
+
+        self.logger.debug("Running PRODUCER burst loop...")
+
+        next_item = cocotb.start_soon(self.seq_item_port.get_next_item())
+
+        while True:
+
+            # Wait for the bus to be idle until a new item is available
+            self.req = await next_item
+
+            self.create_response()
+
+            self.logger.debug(f"PRODUCER (req): data = {self.req.data}")
+
+            self.vif.data.value = self.req.data
+            self.vif.valid.value = 1
+            self.rsp.data = self.req.data
+
+            # Release the item, so the sequence can provide the next one during this clock cycle
+            self.seq_item_port.item_done()
+            self.send_response()
+
+            next_item = cocotb.start_soon(self.seq_item_port.get_next_item())
+
+            await RisingEdge(self.vif.clk)
+
+            # Back-to-back item: keep 'valid' high
+            if not next_item.done():
+                self.reset_bus()
+
     async def consumer_loop(self):
+        """ Event-driven CONSUMER loop.
+        - If 'valid' is already high (back-to-back items) the data is taken right away.
+        - Otherwise it sleeps until 'valid' rises, instead of waking up on every clock.
+        - The item is consumed on the next clock edge.
+        """
 
         self.logger.debug("Running CONSUMER loop...")
         self.logger.debug(f"CONSUMER (req): data = {self.req}")
 
-        while True:
+        await ReadOnly()
+        if not self.vif.valid_is_high():
+            await RisingEdge(self.vif.valid)
             await ReadOnly()
-            if (self.vif.valid.value.binstr == "1"):
-                self.rsp.data = self.vif.data.value
-                await RisingEdge(self.cfg.vif.clk)
-                break
-            await RisingEdge(self.cfg.vif.clk)
+
+        self.rsp.data = self.vif.data.value.integer
+        await RisingEdge(self.vif.clk)
+
         self.logger.debug(f"CONSUMER (rsp): data = {self.rsp}")
 
     def reset_bus(self):
         self.vif.data.value = 0
-        self.vif.valid.value = 0
\ No newline at end of file
+        self.vif.valid.value = 0
+
+    def report_phase(self):
+
+        super().report_phase()
+
+        # Write the remaining recorded beats
+        if self.recorder is not None:
+            self.recorder.close()
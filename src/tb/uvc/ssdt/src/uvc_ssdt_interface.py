@@ -24,3 +24,10 @@ class ssdt_interface_wrapper():
 
         self.valid  = valid_signal
         self.data   = data_signal
+
+    def valid_is_high(self):
+        """ Check if 'valid' is 1. Unresolved values (X/Z) are seen as low.
+        """
+
+        valid = self.valid.value
+        return valid.is_resolvable and valid.integer == 1
@@ -0,0 +1,65 @@
+"""
+SSDT-UVC monitor transaction.
+
+- Compact transaction published by the monitor. It never needs randomization.
+- Can be converted to the randomizable sequence item on demand.
+- Several transactions can be published at once in a batch.
+- Each transaction is tagged by the monitor with a transaction id ('tr_id'), its beat number,
+  and stamped with the simulation time ('time', in simulator steps) when it is sampled.
+"""
+
+from pyuvm import uvm_factory
+from .uvc_ssdt_seq_item import uvc_ssdt_seq_item
+
+
+class uvc_ssdt_mon_item():
+    """ Lightweight SSDT transaction observed by the monitor.
+    - Provides the same accessors used on 'uvc_ssdt_seq_item' by the subscribers.
+    """
+
+    __slots__ = ("name", "data", "tr_id", "time")
+
+    def __init__(self, name="ssdt_mon_item", data=0, tr_id=0, time=0):
+
+        self.name = name
+        self.data = data
+        self.tr_id = tr_id
+        self.time = time
+
+    def get_name(self) -> str:
+        return self.name
+
+    def set_name(self, name):
+        self.name = name
+
+    def clone(self):
+        """ Returns a copy of the transaction. """
+        return uvc_ssdt_mon_item(self.name, self.data, self.tr_id, self.time)
+
+    def to_seq_item(self, parent_inst_path="") -> uvc_ssdt_seq_item:
+        """ Converts the transaction to a (randomizable) sequence item.
+        - Created through the UVM Factory in the context of 'parent_inst_path' (e.g. the full name of the
+          agent monitor), to get the sequence item override of that agent.
+        """
+        item = uvm_factory().create_object_by_type(uvc_ssdt_seq_item, parent_inst_path, self.name)
+        item.data = self.data
+        return item
+
+    def __eq__(self, other) -> bool:
+        """ defines how transactions are compared. """
+        if isinstance(other, uvc_ssdt_mon_item):
+            return (self.data == other.data)
+        else:
+            return False
+
+    def __str__(self) -> str:
+        """ defines output string when printing the transaction. """
+        return (f"{self.name} : data = {self.data}; tr_id = {self.tr_id}; time = {self.time};")
+
+
+class uvc_ssdt_mon_batch(list):
+    """ Batch of SSDT transactions, published by the monitor as a single object.
+    - Subscribers receive it through 'write()' and should forward it to their 'write_batch()'.
+    """
+
+    __slots__ = ()
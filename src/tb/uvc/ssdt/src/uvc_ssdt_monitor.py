@@ -3,9 +3,10 @@
 - UVM monitor is responsible for capturing signal activity from the design interface and translate it into transaction level data objects that can be sent to other components.
 """
 
-from cocotb.triggers import RisingEdge, ReadOnly
+from cocotb.triggers import RisingEdge, ReadOnly, ClockCycles, First
+from cocotb.utils import get_sim_time
 from pyuvm import uvm_monitor, uvm_analysis_port
-from .uvc_ssdt_seq_item import uvc_ssdt_seq_item
+from .uvc_ssdt_mon_item import uvc_ssdt_mon_item, uvc_ssdt_mon_batch
 
 
 class uvc_ssdt_monitor(uvm_monitor):
@@ -24,6 +25,14 @@ class uvc_ssdt_monitor(uvm_monitor):
         self.mon_analysis_port = None   # Analysis port for transaction item
         self.vif = None                 # Virtual interface object
 
+        self.pool = []                  # Pool of recycled transactions
+        self.pool_index = 0
+
+        self.batch = uvc_ssdt_mon_batch()   # Transactions waiting to be published
+        self.batch_cycles = 0               # Clock cycles since the first beat of the batch
+
+        self.tr_id = 0                      # Transaction id of the next beat
+
     def build_phase(self):
 
         super().build_phase()
@@ -37,6 +46,13 @@ class uvc_ssdt_monitor(uvm_monitor):
         # Create an instance of the Analysis Port
         self.mon_analysis_port = uvm_analysis_port.create(f"{self.get_parent().get_name()}_analysis_port", self)
 
+        # A batch keeps its transactions until it is published, so they must not be recycled meanwhile
+        if self.cfg.mon_pool_size and self.cfg.mon_pool_size <= self.cfg.mon_batch_size:
+            raise ValueError(f"'mon_pool_size' ({self.cfg.mon_pool_size}) must be higher than 'mon_batch_size' ({self.cfg.mon_batch_size})")
+
+        # Preallocate the pool of transactions
+        self.pool = [uvc_ssdt_mon_item("sdt_mon_item") for _ in range(0, self.cfg.mon_pool_size)]
+
     async def run_phase(self):
 
         await super().run_phase()
@@ -46,17 +62,98 @@ class uvc_ssdt_monitor(uvm_monitor):
             await RisingEdge(self.vif.clk)
             await ReadOnly()        # Assures signals stability. Where there is no further delta steps in the current timestep.
 
+            # Sleep over idle cycles, until 'valid' rises
+            if self.cfg.mon_idle_skip and not self.vif.valid_is_high():
+                await self.skip_idle_cycles()
+
             # Sample whenever 'valid' == 1
-            if (self.vif.valid.value.binstr == "1"):
+            if self.vif.valid_is_high():
 
                 self.logger.debug("Monitor transaction start ... ")
 
-                # Create an instance of a sequence (transaction) item
-                item = uvc_ssdt_seq_item.create("sdt_mon_item")
+                # Get an instance of a (monitor) transaction item
+                item = self.new_item()
 
                 item.data = self.vif.data.value.integer
+                item.tr_id = self.tr_id
+                item.time = get_sim_time()
+                self.tr_id += 1
 
                 self.logger.debug(f"Monitor transaction end : {item}")
 
                 # Write to Analysis Port
-                self.mon_analysis_port.write(item)
\ No newline at end of file
+                if self.cfg.mon_batch_size:
+                    self.batch.append(item)
+                    if len(self.batch) >= self.cfg.mon_batch_size:
+                        self.write_batch()
+                else:
+                    self.mon_analysis_port.write(item)
+
+            # Publish a partial batch when its time window is over
+            if self.batch:
+                self.count_batch_cycle()
+
+    def count_batch_cycle(self):
+        """ Count a clock cycle of the pending batch, and publish it when its time window is over.
+        """
+
+        self.batch_cycles += 1
+        if self.cfg.mon_batch_window and self.batch_cycles >= self.cfg.mon_batch_window:
+            self.write_batch()
+
+    async def skip_idle_cycles(self):
+        """ Sleep while 'valid' is low and return on the ReadOnly phase where it rises.
+        - As 'valid' is driven synchronously to 'clk', it rises on a clock edge. So the sampled
+          transactions are the same as when sampling on every clock.
+        - The clock cycles slept are counted in the time window of a pending batch, so batches
+          are published on the same cycles as when sampling on every clock ('cfg.clk_period' is needed).
+        """
+
+        valid_rise = RisingEdge(self.vif.valid)
+
+        while self.batch and self.cfg.mon_batch_window:
+
+            # Current (idle) cycle, the batch is published if its window is over
+            self.count_batch_cycle()
+            if not self.batch:
+                break
+
+            if self.cfg.clk_period is None:
+                raise ValueError("'mon_idle_skip' with 'mon_batch_window' needs the clock period ('clk_period')")
+
+            start = get_sim_time()
+
+            await First(valid_rise, ClockCycles(self.vif.clk, self.cfg.mon_batch_window - self.batch_cycles))
+            await ReadOnly()
+
+            # Idle cycles slept before the current one
+            self.batch_cycles += (get_sim_time() - start) // self.cfg.clk_period - 1
+
+            if self.vif.valid_is_high():
+                # The caller samples the beat and counts the current cycle
+                return
+
+        await valid_rise
+        await ReadOnly()
+
+    def write_batch(self):
+        """ Publish the pending transactions as a single batch.
+        """
+
+        batch = self.batch
+        self.batch = uvc_ssdt_mon_batch()
+        self.batch_cycles = 0
+
+        self.logger.debug(f"Monitor batch of {len(batch)} transactions")
+        self.mon_analysis_port.write(batch)
+
+    def new_item(self) -> uvc_ssdt_mon_item:
+        """ Get a transaction, either recycled from the pool or newly allocated.
+        """
+
+        if not self.pool:
+            return uvc_ssdt_mon_item("sdt_mon_item")
+
+        item = self.pool[self.pool_index]
+        self.pool_index = (self.pool_index + 1) % len(self.pool)
+        return item
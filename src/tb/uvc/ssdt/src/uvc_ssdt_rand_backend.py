@@ -0,0 +1,151 @@
+""" SSDT-UVC randomization backends
+
+- The SSDT sequences randomize the 'data' of their items through a backend, so each test can pick the cheapest
+  solver that can express its constraints.
+    - PYVSC: solves the sequence item constraints with PyVSC. Supports any constraint.
+    - CONSTRAINEDRANDOM: 'constrainedrandom' solver over the range of 'data', plus optional extra constraints.
+    - NATIVE: seeded PRNG. Only for pure range constraints.
+"""
+
+import random
+import vsc
+from abc import ABC, abstractmethod
+from enum import IntEnum
+from constrainedrandom import RandObj
+
+
+class uvc_ssdt_rand_backend_enum(IntEnum):
+    """ Randomization backend: PYVSC, CONSTRAINEDRANDOM or NATIVE """
+    PYVSC = 0
+    CONSTRAINEDRANDOM = 1
+    NATIVE = 2
+
+
+class uvc_ssdt_rand_backend(ABC):
+    """ Base class for the randomization backends.
+    - 'rng' is a 'random.Random' object (by default the 'random' module is used).
+    - Backends must implement 'randomize_bulk()' (checked when they are created).
+    """
+
+    def __init__(self, rng=None):
+
+        self.rng = rng if rng is not None else random
+
+    def randomize(self, seq_item):
+        """ Randomize the 'data' of the sequence item. """
+        seq_item.data = self.randomize_bulk(seq_item, 1)[0]
+
+    @abstractmethod
+    def randomize_bulk(self, seq_item, n) -> list:
+        """ Produce 'n' random values for the 'data' of the sequence item. """
+
+
+class uvc_ssdt_pyvsc_backend(uvc_ssdt_rand_backend):
+    """ Backend solving the sequence item constraints with PyVSC.
+    - Bulk draws of items constrained only by a range of 'data' ('DATA_RANGE_ONLY') skip the solver.
+    - With an explicit 'rng', the random state of the items is seeded from it (random stability).
+      Otherwise, PyVSC global random state is used.
+    """
+
+    def __init__(self, rng=None):
+
+        super().__init__(rng)
+
+        self.seeded = rng is not None
+
+    def randomize(self, seq_item):
+
+        if self.seeded:
+            seq_item.set_randstate(vsc.RandState.mkFromSeed(self.rng.getrandbits(32)))
+
+        seq_item.randomize()
+
+    def randomize_bulk(self, seq_item, n) -> list:
+
+        # Pure range constraints: no need to run the solver for each value
+        if type(seq_item).DATA_RANGE_ONLY:
+            return seq_item.randomize_bulk(n, self.rng)
+
+        values = []
+        for _ in range(0, n):
+            self.randomize(seq_item)
+            values.append(seq_item.data)
+
+        return values
+
+
+class uvc_ssdt_constrainedrandom_backend(uvc_ssdt_rand_backend):
+    """ Backend using 'constrainedrandom' over the range of 'data'.
+    - 'constraints' are extra functions of 'data' returning True when the value is allowed.
+    """
+
+    def __init__(self, rng=None, constraints=()):
+
+        super().__init__(rng)
+
+        self.constraints = tuple(constraints)
+        self.rand_objs = {}     # Solver object per sequence item class
+
+    def get_rand_obj(self, seq_item) -> RandObj:
+
+        seq_item_type = type(seq_item)
+
+        if seq_item_type not in self.rand_objs:
+            if not seq_item.DATA_RANGE_ONLY:
+                raise ValueError(f"{seq_item_type.__name__} constraints are not a range of 'data'")
+
+            # 'constrainedrandom' needs a 'random.Random' object
+            rng = self.rng if isinstance(self.rng, random.Random) else random.Random(self.rng.getrandbits(64))
+
+            rand_obj = RandObj(rng)
+            rand_obj.add_rand_var("data",
+                                  domain=range(seq_item.DATA_MIN, seq_item.DATA_MAX+1),
+                                  constraints=self.constraints or None)
+            self.rand_objs[seq_item_type] = rand_obj
+
+        return self.rand_objs[seq_item_type]
+
+    def randomize_bulk(self, seq_item, n) -> list:
+
+        rand_obj = self.get_rand_obj(seq_item)
+
+        values = []
+        for _ in range(0, n):
+            rand_obj.randomize()
+            values.append(rand_obj.data)
+
+        return values
+
+
+class uvc_ssdt_native_backend(uvc_ssdt_rand_backend):
+    """ Backend drawing 'data' directly from the PRNG, for pure range constraints.
+    """
+
+    def randomize(self, seq_item):
+
+        self.check_range_only(seq_item)
+        seq_item.data = self.rng.randint(seq_item.DATA_MIN, seq_item.DATA_MAX)
+
+    def randomize_bulk(self, seq_item, n) -> list:
+
+        self.check_range_only(seq_item)
+        return seq_item.randomize_bulk(n, self.rng)
+
+    def check_range_only(self, seq_item):
+
+        if not seq_item.DATA_RANGE_ONLY:
+            raise ValueError(f"{type(seq_item).__name__} constraints are not a range of 'data'")
+
+
+def ssdt_rand_backend_create(backend_type, rng=None) -> uvc_ssdt_rand_backend:
+    """ Create a randomization backend from its type (uvc_ssdt_rand_backend_enum).
+    """
+
+    if backend_type is uvc_ssdt_rand_backend_enum.PYVSC:
+        return uvc_ssdt_pyvsc_backend(rng)
+    elif backend_type is uvc_ssdt_rand_backend_enum.CONSTRAINEDRANDOM:
+        return uvc_ssdt_constrainedrandom_backend(rng)
+    elif backend_type is uvc_ssdt_rand_backend_enum.NATIVE:
+        return uvc_ssdt_native_backend(rng)
+    else:
+        raise ValueError(f"Not handled randomization backend {backend_type}")
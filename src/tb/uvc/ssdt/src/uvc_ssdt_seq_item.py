@@ -2,6 +2,7 @@
 SSDT-UVC sequence item with constraints using PyVSC.
 """
 
+import random
 import vsc
 from pyuvm import uvm_sequence_item
 
@@ -11,6 +12,13 @@ class uvc_ssdt_seq_item(uvm_sequence_item):
     """ SSDT-UVC base sequence item with constraints.
     """
 
+    # Range of 'data' allowed by the constraints.
+    # Subclasses whose constraints are exactly this range set 'DATA_RANGE_ONLY', so 'randomize_bulk()'
+    # (and the non-PyVSC backends) do not need the solver. Any other constraint must leave it False.
+    DATA_MIN = 0
+    DATA_MAX = 2**64-1
+    DATA_RANGE_ONLY = False
+
     def __init__(self, name):
 
         super().__init__(name)
@@ -20,6 +28,29 @@ class uvc_ssdt_seq_item(uvm_sequence_item):
         self.SSDT_DATA_W = vsc.rand_uint64_t()
         self.data = vsc.rand_bit_t(64)
 
+    def randomize_bulk(self, n, rng=None) -> list:
+        """ Produce 'n' random values for 'data' in one call.
+        - Fast path: if the constraints are only a range of 'data', the values are drawn at once from 'rng'.
+        - Otherwise, the item is randomized 'n' times with pyvsc.
+        - 'rng' is a 'random.Random' object (by default the 'random' module is used).
+        """
+
+        if rng is None:
+            rng = random
+
+        if self.DATA_RANGE_ONLY:
+            # 'choices()' is exact only while the range fits the float mantissa
+            if self.DATA_MAX - self.DATA_MIN < 2**53:
+                return rng.choices(range(self.DATA_MIN, self.DATA_MAX+1), k=n)
+            return [rng.randint(self.DATA_MIN, self.DATA_MAX) for _ in range(0, n)]
+
+        values = []
+        for _ in range(0, n):
+            self.randomize()
+            values.append(self.data)
+
+        return values
+
     def __eq__(self, other) -> bool:
         """ defines how sequence items are compared. """
         if isinstance(other, self.__class__):
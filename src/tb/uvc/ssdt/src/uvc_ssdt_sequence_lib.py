@@ -4,8 +4,14 @@
 - They are executed by an assigned sequencer which then sends data items to the driver. Hence, sequences make up the core stimuli of any verification plan.
 """
 
-from pyuvm import uvm_sequence, uvm_root
+import random
+import cocotb
+from collections import deque
+from cocotb.queue import Queue
+from pyuvm import uvm_sequence, uvm_root, uvm_factory
 from .uvc_ssdt_seq_item import uvc_ssdt_seq_item
+from .uvc_ssdt_rand_backend import uvc_ssdt_rand_backend_enum, ssdt_rand_backend_create
+from .ssdt_common import ssdt_derive_seed
 
 
 # ------------------------------------------------------------------------------
@@ -21,27 +27,88 @@ class uvc_ssdt_base_seq(uvm_sequence):
 
 
         self.cfg = None                 # handle to configuration object
+        self.sequencer = None           # sequencer running the sequence
         self.seq_item = None            # sequence item
         self.rsp = None                 # sequence item reply
         self.seq_was_randomized = 0     # flag to check if sequence was already randomized
+        self.data_values = deque()      # 'data' of the next items, randomized in bulk
+        self.bulk_size = 0              # number of items still to be randomized in bulk
+        self.rand_backend = None        # randomization backend (from the agent configuration if not set)
 
     async def body(self):
         """ This must be overwrite/updated by child.
         Note that the connection to the sequencer will be done on a 'uvm_test' class.
         """
 
+        # The agent passes its configuration to the sequencer
+        if self.sequencer is not None:
+            self.cfg = getattr(self.sequencer, "cfg", None)
+
         await super().body()
 
+    def response_enable(self):
+        """ Check if the driver puts a response for each item.
+        """
+
+        return self.cfg is None or self.cfg.response_enable
+
+    def create_seq_item(self, name="uvc_ssdt_seq_item"):
+        """ Create a sequence item through the UVM Factory, in the context of the sequencer.
+        - This applies the sequence item override of the agent running the sequence.
+        """
+
+        parent_inst_path = "" if self.sequencer is None else self.sequencer.get_full_name()
+        return uvm_factory().create_object_by_type(uvc_ssdt_seq_item, parent_inst_path, name)
+
     def randomize(self):
         """ Randomize sequence.
+        - Before the sequence is started, the agent is not known yet: the item is then created and
+          randomized in 'body()', in the context of the sequencer.
         """
 
+        if self.sequencer is None:
+            self.seq_was_randomized = 0
+            return
+
         if(self.seq_item == None):
-            self.seq_item = uvc_ssdt_seq_item.create("uvc_ssdt_seq_item")
+            self.seq_item = self.create_seq_item()
 
         self.seq_item.randomize()   # Randomize sequence item
         self.seq_was_randomized = 1
 
+    def get_rand_backend(self):
+        """ Get the randomization backend.
+        - If not set by the test, it is the one selected in the agent configuration (PyVSC by default).
+        - With an agent seed, the sequence gets its own random stream, derived from the seed and its name.
+        """
+
+        if self.rand_backend is None:
+            if self.cfg is None:
+                self.rand_backend = ssdt_rand_backend_create(uvc_ssdt_rand_backend_enum.PYVSC)
+            else:
+                rng = None if self.cfg.seed is None else random.Random(ssdt_derive_seed(self.cfg.seed, self.get_name()))
+                self.rand_backend = ssdt_rand_backend_create(self.cfg.rand_backend, rng)
+
+        return self.rand_backend
+
+    def randomize_bulk(self, n):
+        """ Randomize the 'data' of the next 'n' items in one call.
+        - The values are drawn when the sequence runs, as the constraints depend on the agent running it.
+        - The sequence item is then recycled and not solved again for those items.
+        """
+
+        self.bulk_size += n
+
+    def draw_bulk_values(self):
+        """ Draw the values requested by 'randomize_bulk()'.
+        """
+
+        if(self.seq_item == None):
+            self.seq_item = self.create_seq_item()
+
+        self.data_values.extend(self.get_rand_backend().randomize_bulk(self.seq_item, self.bulk_size))
+        self.bulk_size = 0
+
 # ------------------------------------------------------------------------------
 # Default sequence: creates and randomizes seq. item
 # ------------------------------------------------------------------------------
@@ -58,9 +125,16 @@ class uvc_ssdt_default_seq(uvc_ssdt_base_seq):
 
         await super().body()
 
-        if not self.seq_was_randomized:
-            self.seq_item = uvc_ssdt_seq_item.create("uvc_ssdt_seq_item")
-            self.seq_item.randomize()   # Randomize sequence item
+        if self.bulk_size:
+            self.draw_bulk_values()
+
+        if self.data_values:
+            self.seq_item.data = self.data_values.popleft()
+        elif not self.seq_was_randomized:
+            # Without responses the driver does not keep the item, so it can be recycled
+            if self.seq_item is None or self.response_enable():
+                self.seq_item = self.create_seq_item()
+            self.get_rand_backend().randomize(self.seq_item)   # Randomize sequence item
 
         uvm_root().logger.debug(f"Starting item ... {self.seq_item}")
 
@@ -70,7 +144,96 @@ class uvc_ssdt_default_seq(uvc_ssdt_base_seq):
 
         uvm_root().logger.debug("Item finished...")
 
+        # Without responses, the driver updates the request in place
+        if not self.response_enable():
+            self.rsp = self.seq_item
+            return
+
         uvm_root().logger.debug("Getting response...")
         self.rsp = await self.get_response()    # get response from driver of the seq. item
 
-        uvm_root().logger.debug(f"Response got: {self.rsp}")
\ No newline at end of file
+        uvm_root().logger.debug(f"Response got: {self.rsp}")
+
+# ------------------------------------------------------------------------------
+# Stream sequence: sends the values of an iterable/async generator in one body
+# ------------------------------------------------------------------------------
+
+# Marks the end of an async source
+_STREAM_END = object()
+
+class uvc_ssdt_stream_seq(uvc_ssdt_base_seq):
+    """ Stream sequence for the SSDT-UVC.
+        Sends one item per value pulled from 'source', all inside a single (long-lived) body.
+        - 'source' is any iterable or async iterable (e.g. async generator) of 'data' values.
+        - Values are pulled lazily, so the stimulus can be arbitrarily long in constant memory.
+        - Async sources are prefetched up to 'lookahead' values ahead of the driver.
+        - Without 'source', it sends the items requested by 'randomize_bulk()', drawn 'bulk_chunk' values at a time.
+    """
+
+    def __init__(self, name="ssdt_stream_seq"):
+
+        super().__init__(name)
+
+        self.source = None      # Iterable or async iterable of 'data' values
+        self.lookahead = 16     # Maximum number of values prefetched from an async source
+        self.n_items = 0        # Number of items sent
+        self.bulk_chunk = 4096  # Maximum number of values randomized at once (without 'source')
+
+    async def body(self):
+
+        await super().body()
+
+        if self.seq_item is None:
+            self.seq_item = self.create_seq_item()
+
+        source = self.bulk_values() if self.source is None else self.source
+
+        uvm_root().logger.debug(f"Streaming items from {source}...")
+
+        if hasattr(source, "__aiter__"):
+            queue = Queue(maxsize=self.lookahead)
+            cocotb.start_soon(self.prefetch(source, queue))
+
+            while (value := await queue.get()) is not _STREAM_END:
+                await self.send_item(value)
+        else:
+            for value in source:
+                await self.send_item(value)
+
+        uvm_root().logger.debug(f"Stream finished after {self.n_items} items.")
+
+    def bulk_values(self):
+        """ Draw the values requested by 'randomize_bulk()', at most 'bulk_chunk' at a time (constant memory).
+        """
+
+        while self.bulk_size:
+            n = min(self.bulk_size, self.bulk_chunk)
+            self.bulk_size -= n
+            yield from self.get_rand_backend().randomize_bulk(self.seq_item, n)
+
+    async def prefetch(self, source, queue):
+        """ Pull the values of an async source, at most 'lookahead' values ahead.
+        """
+
+        async for value in source:
+            await queue.put(value)
+
+        await queue.put(_STREAM_END)
+
+    async def send_item(self, value):
+        """ Send a single item with 'data' = value.
+        The driver clones the item (or does not keep it without responses), so it is recycled.
+        """
+
+        self.seq_item.data = value
+
+        await self.start_item(self.seq_item)
+
+        await self.finish_item(self.seq_item)
+
+        if self.response_enable():
+            self.rsp = await self.get_response()
+        else:
+            self.rsp = self.seq_item
+
+        self.n_items += 1
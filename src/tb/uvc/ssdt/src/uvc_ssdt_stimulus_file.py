@@ -0,0 +1,193 @@
+""" SSDT-UVC stimulus file
+
+- Flat binary file of fixed-width words (native byte order), memory-mapped.
+- One 'data' word per beat or, with 'with_valid', two words per beat: 'data' and 'valid' (0 = idle cycle).
+- The words are read straight from the mapping, so the file is never loaded into Python lists.
+- Drive it with 'uvc_ssdt_driver.vector_replay_loop(stimulus.data, stimulus.valid)',
+  or stream its valid beats with 'uvc_ssdt_stream_seq' (source = stimulus).
+- Stimulus log: (gap, data) 64-bit word pairs, one per valid beat, where 'gap' is the number of
+  idle clock cycles before the beat. Written by 'uvc_ssdt_stimulus_recorder' and read by 'uvc_ssdt_stimulus_log'.
+"""
+
+import mmap
+import os
+from array import array
+
+# Buffer format of each word size (bytes)
+_WORD_FORMATS = {1: "B", 2: "H", 4: "I", 8: "Q"}
+
+# Number of records buffered by the recorder before writing them to the file
+_RECORDER_CHUNK_SIZE_ = 4096
+
+
+def _ssdt_map_words(path, word_size, record_words):
+    """ Open and map 'path' as a flat array of 'word_size' words.
+    - Returns the (file, mmap, words) tuple. 'mmap' is None for an empty file (it cannot be mapped).
+    """
+
+    if word_size not in _WORD_FORMATS:
+        raise ValueError(f"Not supported word size {word_size}, must be one of {list(_WORD_FORMATS)}")
+
+    record_size = word_size*record_words
+    file_size = os.path.getsize(path)
+    if file_size % record_size:
+        raise ValueError(f"Size of '{path}' ({file_size} bytes) is not a multiple of {record_size} bytes")
+
+    file = open(path, "rb")
+
+    if file_size:
+        words_map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        words = memoryview(words_map).cast(_WORD_FORMATS[word_size])
+    else:
+        words_map = None
+        words = memoryview(b"").cast(_WORD_FORMATS[word_size])
+
+    return file, words_map, words
+
+
+class uvc_ssdt_stimulus_file():
+    """ Memory-mapped SSDT stimulus file.
+    """
+
+    def __init__(self, path, word_size=8, with_valid=False):
+
+        self.path = path
+        self.word_size = word_size
+        self.with_valid = with_valid
+
+        self.file, self.mmap, self.words = _ssdt_map_words(path, word_size, 2 if with_valid else 1)
+
+        # Zero-copy (strided) views of each column
+        if with_valid:
+            self.data = self.words[0::2]
+            self.valid = self.words[1::2]
+        else:
+            self.data = self.words
+            self.valid = None
+
+    def __len__(self):
+        """ Number of beats (including idle cycles). """
+        return len(self.data)
+
+    def __iter__(self):
+        """ Iterate over the 'data' of the valid beats. """
+        if self.valid is None:
+            return iter(self.data)
+        return (data for data, valid in zip(self.data, self.valid) if valid)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """ Release the views and unmap the file. """
+
+        if self.valid is not None:
+            self.valid.release()
+            self.data.release()
+        self.words.release()
+
+        if self.mmap is not None:
+            self.mmap.close()
+        self.file.close()
+
+    @staticmethod
+    def write(path, data, valid=None, word_size=8):
+        """ Write a stimulus file from 'data' (and optionally 'valid') values.
+        """
+
+        if word_size not in _WORD_FORMATS:
+            raise ValueError(f"Not supported word size {word_size}, must be one of {list(_WORD_FORMATS)}")
+
+        words = array(_WORD_FORMATS[word_size], data)
+
+        if valid is not None:
+            if len(valid) != len(words):
+                raise ValueError(f"'data' ({len(words)}) and 'valid' ({len(valid)}) must have the same length")
+            records = array(_WORD_FORMATS[word_size], bytes(word_size*2*len(words)))
+            records[0::2] = words
+            records[1::2] = array(_WORD_FORMATS[word_size], valid)
+            words = records
+
+        with open(path, "wb") as f:
+            words.tofile(f)
+
+
+class uvc_ssdt_stimulus_log():
+    """ Memory-mapped SSDT stimulus log (see 'uvc_ssdt_stimulus_recorder').
+    - 'gaps' and 'data' are zero-copy views of the two columns.
+    """
+
+    def __init__(self, path):
+
+        self.path = path
+
+        self.file, self.mmap, self.words = _ssdt_map_words(path, 8, 2)
+
+        self.gaps = self.words[0::2]
+        self.data = self.words[1::2]
+
+    def __len__(self):
+        """ Number of valid beats. """
+        return len(self.data)
+
+    def __iter__(self):
+        """ Iterate over the (gap, data) records. """
+        return zip(self.gaps, self.data)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """ Release the views and unmap the file. """
+
+        self.gaps.release()
+        self.data.release()
+        self.words.release()
+
+        if self.mmap is not None:
+            self.mmap.close()
+        self.file.close()
+
+
+class uvc_ssdt_stimulus_recorder():
+    """ Writer of SSDT stimulus logs.
+    - The records are buffered and written to the file in chunks.
+    """
+
+    def __init__(self, path, chunk_size=_RECORDER_CHUNK_SIZE_):
+
+        self.path = path
+        self.chunk_size = chunk_size
+
+        self.file = open(path, "wb")
+        self.records = array("Q")
+
+    def record(self, gap, data):
+        """ Record a valid beat, driven after 'gap' idle clock cycles. """
+
+        self.records.append(gap)
+        self.records.append(data)
+
+        if len(self.records) >= 2*self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """ Write the buffered records to the file. """
+
+        self.records.tofile(self.file)
+        del self.records[:]
+
+    def close(self):
+        """ Flush the buffered records and close the file. """
+
+        if self.file.closed:
+            return
+
+        self.flush()
+        self.file.close()
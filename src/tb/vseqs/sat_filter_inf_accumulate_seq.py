@@ -1,7 +1,7 @@
 import vsc
 import cocotb
 
-from cocotb.triggers import ReadOnly, NextTimeStep, First
+from cocotb.triggers import Combine
 from pyuvm import uvm_root
 
 from sat_filter_tb_base_seq import sat_filter_tb_base_seq
@@ -27,7 +27,7 @@ class sat_filter_inf_accumulate_seq(sat_filter_tb_base_seq):
         self.data_adder_max = vsc.rand_uint32_t()
         self.data_adder = 0
 
-        # Controls the loop launching the tasks
+        # Controls the loops launching the sequences
         self.main_loop_flag = True
 
     async def body(self):
@@ -37,52 +37,42 @@ class sat_filter_inf_accumulate_seq(sat_filter_tb_base_seq):
 
         uvm_root().logger.info(f"{'-'*30} Max. value of the accumulator = {self.data_adder_max} {'-'*30}")
 
-        # Launch tasks
-        prod_task = await cocotb.start(self.producer_seq.start(self.sequencer.ssdt_producer_sequencer))
-        cons_task = await cocotb.start(self.consumer_seq.start(self.sequencer.ssdt_consumer_sequencer))
-        cons_mon_task = await cocotb.start(self.monitor_consumer_rsp(cons_task))
+        # Each loop relaunches its sequence until the accumulator reaches the maximum value.
+        # The consumer loop reports each response as soon as its sequence finishes (no polling).
+        prod_task = cocotb.start_soon(self.producer_loop())
+        cons_task = cocotb.start_soon(self.consumer_loop())
 
-        # Just for debug
-        prod_task_cnt = 1
-        cons_task_cnt = 1
-        cons_mon_task_cnt = 1
+        await Combine(prod_task, cons_task)
+
+    async def producer_loop(self):
+        """ Relaunch the producer sequence until the accumulator is full. """
+
+        prod_task_cnt = 0   # Just for debug
 
-        # Main loop
         while self.main_loop_flag:
+            prod_task_cnt += 1
+            uvm_root().logger.debug(f"{'-'*30} Launch producer sequence #{prod_task_cnt} {'-'*30}")
+            await self.producer_seq.start(self.sequencer.ssdt_producer_sequencer)
 
-            # Launch producer task if stopped
-            if prod_task.done():
-                prod_task_cnt += 1
-                uvm_root().logger.debug(f"{'-'*30} Launch producer sequence task #{prod_task_cnt} {'-'*30}")
-                prod_task = await cocotb.start(self.producer_seq.start(self.sequencer.ssdt_producer_sequencer))
-
-            # Launch consumer task if stopped
-            if cons_task.done():
-                cons_task_cnt += 1
-                uvm_root().logger.debug(f"{'-'*30} Launch consumer sequence task #{prod_task_cnt} {'-'*30}")
-                cons_task = await cocotb.start(self.consumer_seq.start(self.sequencer.ssdt_consumer_sequencer))
-
-            # Launch monitor task if stopped
-            if cons_mon_task.done():
-                cons_mon_task_cnt += 1
-                uvm_root().logger.debug(f"{'-'*30} Launch consumer monitor task #{cons_mon_task_cnt} {'-'*30}")
-                cons_mon_task = await cocotb.start(self.monitor_consumer_rsp(cons_task))
-
-            # Await for any to finish
-            await First(prod_task, cons_task)
-
-    async def monitor_consumer_rsp(self, task):
-        """ Method that updates de accumulated value whenever the consumer task finishes.
-        Stops sequence when reaches to the maximum value.
-        """
+    async def consumer_loop(self):
+        """ Relaunch the consumer sequence until the accumulator is full. """
+
+        cons_task_cnt = 0   # Just for debug
 
-        # Wait for task to finish
-        while not task.done():
-            await ReadOnly()
-            await NextTimeStep()
+        while self.main_loop_flag:
+            cons_task_cnt += 1
+            uvm_root().logger.debug(f"{'-'*30} Launch consumer sequence #{cons_task_cnt} {'-'*30}")
+            await self.consumer_seq.start(self.sequencer.ssdt_consumer_sequencer)
+
+            self.consumer_rsp_done(self.consumer_seq.rsp)
+
+    def consumer_rsp_done(self, rsp):
+        """ Completion callback of the consumer sequence: updates the accumulated value.
+        Stops the sequence loops when it reaches the maximum value.
+        """
 
-        uvm_root().logger.info(f"{self.get_full_name()} | Adder: {self.data_adder}, Resp: {self.consumer_seq.rsp}\n")
-        self.data_adder += self.consumer_seq.rsp.data
+        uvm_root().logger.info(f"{self.get_full_name()} | Adder: {self.data_adder}, Resp: {rsp}\n")
+        self.data_adder += rsp.data
 
         if self.data_adder >= self.data_adder_max:
             self.main_loop_flag = False
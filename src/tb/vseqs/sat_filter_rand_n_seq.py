@@ -1,18 +1,21 @@
 import vsc
 import cocotb
+import itertools
 
 from cocotb.triggers import Combine
 from pyuvm import uvm_root
 
 from sat_filter_tb_base_seq import sat_filter_tb_base_seq
-from uvc.ssdt.src.uvc_ssdt_sequence_lib import uvc_ssdt_default_seq
+from uvc.ssdt.src.uvc_ssdt_sequence_lib import uvc_ssdt_default_seq, uvc_ssdt_stream_seq
 
 # ------------------------------------------------------------------------------------------
 # Sequence that launches a random number of sequences on each agent
 # ------------------------------------------------------------------------------------------
 @vsc.randobj
 class sat_filter_rand_n_seq(sat_filter_tb_base_seq):
-    """ Launch a random number of sequences on each agent.
+    """ Launch a random number of items on each agent.
+    - By default, all the items of an agent are sent inside a single (stream) sequence body.
+    - With 'per_item_seqs', a sequence is started for each item instead.
     """
 
     def __init__(self, name="ssdt_b2b_rand_n_seq"):
@@ -23,8 +26,14 @@ class sat_filter_rand_n_seq(sat_filter_tb_base_seq):
         self.producer_seq = uvc_ssdt_default_seq.create("sat_filter_ssdt_prod_seq")
         self.consumer_seq = uvc_ssdt_default_seq.create("sat_filter_ssdt_cons_seq")
 
+        self.producer_stream_seq = uvc_ssdt_stream_seq.create("sat_filter_ssdt_prod_stream_seq")
+        self.consumer_stream_seq = uvc_ssdt_stream_seq.create("sat_filter_ssdt_cons_stream_seq")
+
         self.number_of_seqs = vsc.rand_uint32_t()
 
+        # Start a sequence per item instead of a single sequence per agent
+        self.per_item_seqs = False
+
     async def body(self):
 
         # Launch sequences
@@ -32,14 +41,21 @@ class sat_filter_rand_n_seq(sat_filter_tb_base_seq):
 
         uvm_root().logger.info(f"{'-'*30} Launching {self.number_of_seqs} sequences. {'-'*30}")
 
-        prod_task = cocotb.start_soon(self.prod_transactions())
-        cons_task = cocotb.start_soon(self.cons_transactions())
+        if self.per_item_seqs:
+            prod_task = cocotb.start_soon(self.prod_transactions())
+            cons_task = cocotb.start_soon(self.cons_transactions())
+        else:
+            prod_task = cocotb.start_soon(self.prod_stream())
+            cons_task = cocotb.start_soon(self.cons_stream())
 
         # Finishes when all tasks finishes
         await Combine(prod_task, cons_task)
 
     async def prod_transactions(self):
 
+        # Randomize the 'data' of all items at once
+        self.producer_seq.randomize_bulk(self.number_of_seqs)
+
         for _ in range(0, self.number_of_seqs):
             await self.producer_seq.start(self.sequencer.ssdt_producer_sequencer)
 
@@ -48,6 +64,20 @@ class sat_filter_rand_n_seq(sat_filter_tb_base_seq):
         for _ in range(0, self.number_of_seqs):
             await self.consumer_seq.start(self.sequencer.ssdt_consumer_sequencer)
 
+    async def prod_stream(self):
+
+        # Random 'data' of all the items, drawn in bulk by the stream sequence
+        self.producer_stream_seq.randomize_bulk(self.number_of_seqs)
+
+        await self.producer_stream_seq.start(self.sequencer.ssdt_producer_sequencer)
+
+    async def cons_stream(self):
+
+        # The consumer only needs the number of items ('data' is taken from the bus)
+        self.consumer_stream_seq.source = itertools.repeat(0, self.number_of_seqs)
+
+        await self.consumer_stream_seq.start(self.sequencer.ssdt_consumer_sequencer)
+
     @vsc.constraint
     def number_of_seqs_pos(self):
         self.number_of_seqs > 0